@@ -3,18 +3,40 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List
 
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from config.settings import settings
-
 from ..database.models import LiquiditySnapshot, PairAlert, TokenPair
+from ..database.setup import create_db_engine
 from .dexscreener import DexScreenerClient
 from .liquidity_analyzer import LiquidityAnalyzer
 from .solana_client import SolanaClient
 
 logger = logging.getLogger(__name__)
 
+# Fields stored in PairAlert.alert_data. analyze_pair returns the annotated
+# pair dict, so the raw DexScreener payload (raw_data) is left out here
+_ALERT_DATA_FIELDS = (
+    "pair_address",
+    "alert_type",
+    "opportunity_score",
+    "safety_score",
+    "momentum_score",
+    "freshness_score",
+    "combined_score",
+    "liquidity_usd",
+    "volume_24h_usd",
+    "base_symbol",
+    "quote_symbol",
+    "dex_name",
+    "price_usd",
+    "market_cap_usd",
+    "txns_24h",
+    "age_hours",
+    "volume_to_liquidity_ratio",
+    "price_change_24h",
+    "reasoning",
+)
+
 
 class DataCollector:
     """Main data collection orchestrator"""
@@ -25,7 +47,7 @@ class DataCollector:
         self.analyzer = LiquidityAnalyzer()
 
         # Database setup
-        self.engine = create_engine(settings.database_url)
+        self.engine = create_db_engine()
         self.SessionLocal = sessionmaker(bind=self.engine)
 
         # Collection settings
@@ -177,7 +199,9 @@ class DataCollector:
                 confidence_score=alert_data["confidence_score"],
                 liquidity_usd=alert_data["liquidity_usd"],
                 volume_24h_usd=alert_data.get("volume_24h_usd"),
-                alert_data=alert_data,
+                alert_data={
+                    field: alert_data.get(field) for field in _ALERT_DATA_FIELDS
+                },
             )
 
             session.add(alert)
@@ -1,4 +1,5 @@
 import asyncio
+import heapq
 import random
 import string
 import time
@@ -6,14 +7,17 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 import httpx
+import orjson
 
 
 class MassiveDexScreenerClient:
     """MASSIVE scanner - find 500+ opportunities using multiple strategies"""
 
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.base_url = "https://api.dexscreener.com/latest"
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # An injected client belongs to the caller and is left open on close()
+        self.owns_client = client is None
+        self.client = client or httpx.AsyncClient(timeout=30.0)
         self.rate_limit_delay = 0.3  # Even faster
         self.last_request_time = 0
         self.seen_pairs = set()
@@ -31,13 +35,15 @@ class MassiveDexScreenerClient:
             self.last_request_time = time.time()
 
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             return None
 
         except Exception as e:
             return None
 
-    async def scan_massive_opportunities(self) -> List[Dict]:
+    async def scan_massive_opportunities(
+        self, limit: Optional[int] = None
+    ) -> List[Dict]:
         """MASSIVE SCAN - use every strategy to find 500+ opportunities"""
         print("🚀 MASSIVE SCAN: Using ALL strategies to find 500+ opportunities...")
         all_opportunities = []
@@ -61,7 +67,7 @@ class MassiveDexScreenerClient:
         await self.strategy_6_search_discovery(all_opportunities)
 
         # Remove duplicates and sort
-        unique_opportunities = self.deduplicate_and_sort(all_opportunities)
+        unique_opportunities = self.deduplicate_and_sort(all_opportunities, limit)
 
         print(
             f"🎉 MASSIVE SCAN COMPLETE: {len(unique_opportunities)} TOTAL OPPORTUNITIES!"
@@ -356,8 +362,10 @@ class MassiveDexScreenerClient:
         except Exception as e:
             return False
 
-    def deduplicate_and_sort(self, opportunities: List[Dict]) -> List[Dict]:
-        """Remove duplicates and sort by potential"""
+    def deduplicate_and_sort(
+        self, opportunities: List[Dict], limit: Optional[int] = None
+    ) -> List[Dict]:
+        """Remove duplicates and sort by potential, keeping the top limit if set"""
         unique_opportunities = []
         seen_addresses = set()
 
@@ -373,6 +381,10 @@ class MassiveDexScreenerClient:
             volume = float(pair.get("volume", {}).get("h24", 0) or 0)
             return liquidity * volume
 
+        # Callers that only consume the top few skip sorting the whole tail
+        if limit is not None:
+            return heapq.nlargest(limit, unique_opportunities, key=opportunity_score)
+
         unique_opportunities.sort(key=opportunity_score, reverse=True)
         return unique_opportunities
 
@@ -383,9 +395,9 @@ class MassiveDexScreenerClient:
             return data["pairs"]
         return []
 
-    async def get_latest_pairs(self) -> List[Dict]:
+    async def get_latest_pairs(self, limit: Optional[int] = None) -> List[Dict]:
         """Main entry point - MASSIVE scan"""
-        return await self.scan_massive_opportunities()
+        return await self.scan_massive_opportunities(limit)
 
     def parse_pair_data(self, raw_pair: Dict) -> Dict:
         """Parse pair data"""
@@ -427,4 +439,5 @@ class MassiveDexScreenerClient:
             return None
 
     async def close(self):
-        await self.client.aclose()
+        if self.owns_client:
+            await self.client.aclose()
@@ -3,15 +3,88 @@ Lightweight Token Scanner
 Fast, focused scanning that completes in 10-15 seconds
 Designed to replace the blocking MassiveDexScreenerClient
 """
-import asyncio
+import bisect
+import heapq
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
+SOL_TOKEN_ADDRESS = "So11111111111111111111111111111111111111112"
+SOL_SEARCH_PARAMS = {"q": "SOL"}
+
+# Freshness score bands: pairs up to _AGE_BINS[i] hours old score _AGE_SCORES[i]
+_AGE_BINS = (1, 6, 24, 48, 72)
+_AGE_SCORES = (1.0, 0.9, 0.7, 0.5, 0.3)
+
+# Both scan filters require at least this much liquidity, so raw pairs below it
+# are dropped before parsing
+_MIN_SCAN_LIQUIDITY_USD = 500
+
+# Alert type bands for quick_scan, same lookup scheme as the freshness bands
+_ALERT_AGE_BINS = (1, 6)
+_ALERT_AGE_TYPES = ("BRAND_NEW_LAUNCH", "VIRAL_FRESH_TOKEN", "TRENDING_NEW_TOKEN")
+
+
+def _has_scan_liquidity(pair: Dict) -> bool:
+    """Cheap pre-filter on the raw DexScreener pair before full parsing"""
+    try:
+        liquidity_usd = float((pair.get("liquidity") or {}).get("usd") or 0)
+    except (TypeError, ValueError, AttributeError):
+        return False  # Malformed pair - skip it rather than fail the scan
+    return liquidity_usd >= _MIN_SCAN_LIQUIDITY_USD
+
+
+@dataclass(slots=True)
+class ParsedPair:
+    """Fixed-layout pair record used while filtering scan candidates"""
+
+    pair_address: str
+    base_token: str
+    quote_token: str
+    base_symbol: str
+    quote_symbol: str
+    dex_name: str
+    liquidity_usd: float
+    volume_24h_usd: float
+    price_usd: float
+    price_change_24h: float
+    txns_24h: int
+    market_cap_usd: float
+    age_hours: float
+    volume_to_liquidity_ratio: float
+    freshness_score: float = 0.0
+    combined_score: float = 0.0
+
+    def to_dict(self) -> Dict:
+        """Opportunity dict in the format the bots consume"""
+        return {
+            "pair_address": self.pair_address,
+            "base_token": self.base_token,
+            "quote_token": self.quote_token,
+            "base_symbol": self.base_symbol,
+            "quote_symbol": self.quote_symbol,
+            "dex_name": self.dex_name,
+            "total_liquidity_usd": self.liquidity_usd,
+            "liquidity_usd": self.liquidity_usd,
+            "volume_24h_usd": self.volume_24h_usd,
+            "price_usd": self.price_usd,
+            "price_change_24h": self.price_change_24h,
+            "txns_24h": self.txns_24h,
+            "market_cap_usd": self.market_cap_usd,
+            "age_hours": self.age_hours,
+            "volume_to_liquidity_ratio": self.volume_to_liquidity_ratio,
+            "url": f"https://dexscreener.com/solana/{self.pair_address}",
+            "source": "lightweight_scanner",
+            "freshness_score": self.freshness_score,
+            "combined_score": self.combined_score,
+        }
+
 
 class LightweightTokenScanner:
     """
@@ -19,9 +92,13 @@ class LightweightTokenScanner:
     Focuses on essential endpoints and limits results for fast completion
     """
 
-    def __init__(self):
-        self.http_client = httpx.AsyncClient(timeout=15.0)
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        # An injected client is shared with other scanners and left open
+        self.owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(timeout=15.0, http2=True)
         self.base_url = "https://api.dexscreener.com/latest/dex"
+        self._url_search = f"{self.base_url}/search/"
+        self._url_sol_token = f"{self.base_url}/tokens/{SOL_TOKEN_ADDRESS}"
 
     async def get_fresh_opportunities(self, max_pairs: int = 25) -> List[Dict]:
         """
@@ -61,13 +138,13 @@ class LightweightTokenScanner:
                 )
                 fresh_opportunities.extend(sol_pairs)
 
-            # Sort by freshness score (newest first)
-            fresh_opportunities.sort(
-                key=lambda x: x.get("freshness_score", 0), reverse=True
+            # Take the top pairs by freshness score (newest first)
+            return heapq.nlargest(
+                max_pairs,
+                fresh_opportunities,
+                key=lambda x: x.get("freshness_score", 0),
             )
 
-            return fresh_opportunities[:max_pairs]
-
         except Exception as e:
             logger.error(f"Error in lightweight scan: {e}")
             return []
@@ -76,21 +153,27 @@ class LightweightTokenScanner:
         """Get latest pairs from Solana DEXs - more likely to be fresh"""
         try:
             # This endpoint often has newer pairs
-            url = f"{self.base_url}/search/?q=SOL"
-
-            response = await self.http_client.get(url)
+            response = await self.http_client.get(
+                self._url_search, params=SOL_SEARCH_PARAMS
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             pairs = data.get("pairs", [])
 
             logger.info(f"📊 Found {len(pairs)} pairs from search endpoint")
 
             fresh_opportunities = []
-            for pair in pairs[: max_pairs * 2]:
+            for pair in filter(_has_scan_liquidity, pairs[: max_pairs * 2]):
                 parsed = self._parse_pair_data(pair)
-                if parsed and self._is_fresh_opportunity(parsed):
-                    fresh_opportunities.append(parsed)
+                if not parsed:
+                    continue
+
+                passes, freshness_score, combined_score = self._score_fresh(parsed)
+                if passes:
+                    parsed.freshness_score = freshness_score
+                    parsed.combined_score = combined_score
+                    fresh_opportunities.append(parsed.to_dict())
 
                     if len(fresh_opportunities) >= max_pairs:
                         break
@@ -105,24 +188,22 @@ class LightweightTokenScanner:
         """Fallback: Get SOL token pairs"""
         try:
             # Get SOL pairs from DexScreener
-            url = f"{self.base_url}/tokens/So11111111111111111111111111111111111111112"  # SOL token address
-
-            response = await self.http_client.get(url)
+            response = await self.http_client.get(self._url_sol_token)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             pairs = data.get("pairs", [])
 
             logger.info(f"📊 Processing {len(pairs)} SOL pairs...")
 
             # For SOL pairs, be more permissive on age since they tend to be older
             fresh_opportunities = []
-            for pair in pairs[: max_pairs * 2]:
+            for pair in filter(_has_scan_liquidity, pairs[: max_pairs * 2]):
                 parsed = self._parse_pair_data(pair)
                 if parsed and self._is_quality_pair(
                     parsed
                 ):  # Use quality filter instead of freshness
-                    fresh_opportunities.append(parsed)
+                    fresh_opportunities.append(parsed.to_dict())
 
                     if len(fresh_opportunities) >= max_pairs:
                         break
@@ -133,52 +214,56 @@ class LightweightTokenScanner:
             logger.error(f"Error scanning SOL pairs: {e}")
             return []
 
-    def _is_quality_pair(self, pair: Dict) -> bool:
+    def _is_quality_pair(self, pair: ParsedPair) -> bool:
         """
         Alternative filter for quality pairs when fresh pairs aren't available
         """
-        try:
-            liquidity_usd = pair.get("total_liquidity_usd", 0)
-            volume_24h = pair.get("volume_24h_usd", 0)
+        liquidity_usd = pair.liquidity_usd
+        volume_24h = pair.volume_24h_usd
 
-            # Quality criteria (not age-dependent)
-            if liquidity_usd < 1000:  # At least $1k liquidity
-                return False
-
-            if volume_24h < 100:  # At least $100 volume
-                return False
+        # Quality criteria (not age-dependent)
+        if liquidity_usd < 1000:  # At least $1k liquidity
+            return False
 
-            # Calculate a quality score based on activity
-            volume_to_liq = volume_24h / liquidity_usd if liquidity_usd > 0 else 0
+        if volume_24h < 100:  # At least $100 volume
+            return False
 
-            # Give it a reasonable score based on activity
-            if volume_to_liq > 0.5:
-                quality_score = 0.8
-            elif volume_to_liq > 0.1:
-                quality_score = 0.6
-            else:
-                quality_score = 0.4
+        # Calculate a quality score based on activity
+        volume_to_liq = volume_24h / liquidity_usd
 
-            pair["freshness_score"] = quality_score
-            pair["combined_score"] = quality_score * (1 + min(volume_to_liq, 1))
+        # Give it a reasonable score based on activity
+        if volume_to_liq > 0.5:
+            quality_score = 0.8
+        elif volume_to_liq > 0.1:
+            quality_score = 0.6
+        else:
+            quality_score = 0.4
 
-            return quality_score > 0.3
+        pair.freshness_score = quality_score
+        pair.combined_score = quality_score * (1 + min(volume_to_liq, 1))
 
-        except Exception:
-            return False
+        return quality_score > 0.3
 
-    def _parse_pair_data(self, pair: Dict) -> Optional[Dict]:
+    def _parse_pair_data(self, pair: Dict) -> Optional[ParsedPair]:
         """
         Parse pair data from DexScreener API response
         Simplified parsing for speed
         """
         try:
+            base_token = pair.get("baseToken")
+            quote_token = pair.get("quoteToken")
+
             # Basic validation
-            if not pair.get("baseToken") or not pair.get("quoteToken"):
+            if not base_token or not quote_token or not pair.get("pairAddress"):
                 return None
 
-            base_token = pair["baseToken"]
-            quote_token = pair["quoteToken"]
+            # Get liquidity and volume
+            liquidity_usd = float((pair.get("liquidity") or {}).get("usd") or 0)
+            volume_24h = float((pair.get("volume") or {}).get("h24") or 0)
+
+            # Skip if no meaningful data
+            if liquidity_usd < 100 and volume_24h < 50:
+                return None
 
             # Calculate age
             age_hours = 999
@@ -186,107 +271,63 @@ class LightweightTokenScanner:
                 created_time = datetime.fromtimestamp(pair["pairCreatedAt"] / 1000)
                 age_hours = (datetime.now() - created_time).total_seconds() / 3600
 
-            # Get liquidity and volume
-            liquidity_usd = float(pair.get("liquidity", {}).get("usd", 0) or 0)
-            volume_24h = float(pair.get("volume", {}).get("h24", 0) or 0)
-
-            # Skip if no meaningful data
-            if liquidity_usd < 100 and volume_24h < 50:
-                return None
-
-            return {
-                "pair_address": pair.get("pairAddress", ""),
-                "base_token": base_token.get("address", ""),
-                "quote_token": quote_token.get("address", ""),
-                "base_symbol": base_token.get("symbol", "UNKNOWN"),
-                "quote_symbol": quote_token.get("symbol", "SOL"),
-                "dex_name": pair.get("dexId", "unknown"),
-                "total_liquidity_usd": liquidity_usd,
-                "liquidity_usd": liquidity_usd,
-                "volume_24h_usd": volume_24h,
-                "price_usd": float(pair.get("priceUsd", 0) or 0),
-                "price_change_24h": float(
-                    pair.get("priceChange", {}).get("h24", 0) or 0
-                ),
-                "txns_24h": (pair.get("txns", {}).get("h24", {}).get("buys", 0) or 0)
-                + (pair.get("txns", {}).get("h24", {}).get("sells", 0) or 0),
-                "market_cap_usd": float(pair.get("marketCap", 0) or 0),
-                "age_hours": age_hours,
-                "volume_to_liquidity_ratio": volume_24h / liquidity_usd
+            txns_24h = (pair.get("txns") or {}).get("h24") or {}
+
+            return ParsedPair(
+                pair_address=pair["pairAddress"],
+                base_token=base_token.get("address", ""),
+                quote_token=quote_token.get("address", ""),
+                base_symbol=base_token.get("symbol", "UNKNOWN"),
+                quote_symbol=quote_token.get("symbol", "SOL"),
+                dex_name=pair.get("dexId", "unknown"),
+                liquidity_usd=liquidity_usd,
+                volume_24h_usd=volume_24h,
+                price_usd=float(pair.get("priceUsd") or 0),
+                price_change_24h=float((pair.get("priceChange") or {}).get("h24") or 0),
+                txns_24h=(txns_24h.get("buys") or 0) + (txns_24h.get("sells") or 0),
+                market_cap_usd=float(pair.get("marketCap") or 0),
+                age_hours=age_hours,
+                volume_to_liquidity_ratio=volume_24h / liquidity_usd
                 if liquidity_usd > 0
                 else 0,
-                "url": f"https://dexscreener.com/solana/{pair.get('pairAddress', '')}",
-                "source": "lightweight_scanner",
-            }
+            )
 
-        except Exception as e:
+        except (TypeError, ValueError, AttributeError, OverflowError) as e:
+            # Skip only the malformed pair, not the whole scan
             logger.error(f"Error parsing pair data: {e}")
             return None
 
-    def _is_fresh_opportunity(self, pair: Dict) -> bool:
+    def _score_fresh(self, pair: ParsedPair) -> Tuple[bool, float, float]:
         """
-        Quick filter for fresh opportunities
+        Quick filter and freshness score for fresh opportunities
         More permissive than the full analyzer for speed
+        Returns (passes_filter, freshness_score, combined_score)
         """
-        try:
-            age_hours = pair.get("age_hours", 999)
-            liquidity_usd = pair.get("total_liquidity_usd", 0)
-            volume_24h = pair.get("volume_24h_usd", 0)
-
-            # Fresh token criteria (focused on truly fresh)
-            if age_hours > 72:  # Must be less than 72 hours old
-                return False
+        age_hours = pair.age_hours
+        liquidity_usd = pair.liquidity_usd
+        volume_24h = pair.volume_24h_usd
 
-            if liquidity_usd < 500:  # Minimum liquidity
-                return False
+        # Fresh token criteria: < 72 hours old, minimum liquidity and volume
+        band = bisect.bisect_left(_AGE_BINS, age_hours)
+        if band == len(_AGE_BINS) or liquidity_usd < 500 or volume_24h < 50:
+            return False, 0.0, 0.0
 
-            if volume_24h < 50:  # Minimum volume
-                return False
+        freshness_score = _AGE_SCORES[band]
 
-            # Calculate freshness score quickly
-            freshness_score = self._calculate_quick_freshness_score(pair)
-            pair["freshness_score"] = freshness_score
+        # Basic momentum check
+        volume_to_liq = pair.volume_to_liquidity_ratio
+        if volume_to_liq > 0.1:  # Some momentum
+            combined_score = freshness_score * (1 + min(volume_to_liq, 2))
+        else:
+            combined_score = freshness_score
 
-            # Basic momentum check
-            volume_to_liq = pair.get("volume_to_liquidity_ratio", 0)
-            if volume_to_liq > 0.1:  # Some momentum
-                pair["combined_score"] = freshness_score * (1 + min(volume_to_liq, 2))
-            else:
-                pair["combined_score"] = freshness_score
-
-            return freshness_score > 0.3  # Standard freshness threshold
-
-        except Exception:
-            return False
-
-    def _calculate_quick_freshness_score(self, pair: Dict) -> float:
-        """
-        Quick freshness score calculation
-        Simplified version of the full analyzer
-        """
-        try:
-            age_hours = pair.get("age_hours", 999)
-
-            if age_hours <= 1:
-                return 1.0  # Brand new
-            elif age_hours <= 6:
-                return 0.9  # Very fresh
-            elif age_hours <= 24:
-                return 0.7  # Fresh
-            elif age_hours <= 48:
-                return 0.5  # Moderately fresh
-            else:
-                return 0.3  # Still within 72h window
-
-        except Exception:
-            return 0.1
+        # Standard freshness threshold
+        return freshness_score > 0.3, freshness_score, combined_score
 
     async def close(self):
-        """Close HTTP client"""
-        try:
+        """Close the HTTP client if this scanner created it"""
+        if self.owns_http_client:
             await self.http_client.aclose()
-        except Exception as e:
-            logger.error(f"Error closing HTTP client: {e}")
 
 
 class FastSnifferBot:
@@ -295,8 +336,8 @@ class FastSnifferBot:
     Focuses on speed and reliability over comprehensive coverage
     """
 
-    def __init__(self):
-        self.scanner = LightweightTokenScanner()
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        self.scanner = LightweightTokenScanner(http_client)
 
     async def quick_scan(self, max_results: int = 15) -> List[Dict]:
         """
@@ -314,21 +355,18 @@ class FastSnifferBot:
             scored_opportunities = []
             for opp in opportunities:
                 # Add alert type based on freshness
-                age_hours = opp.get("age_hours", 999)
-                if age_hours <= 1:
-                    opp["alert_type"] = "BRAND_NEW_LAUNCH"
-                elif age_hours <= 6:
-                    opp["alert_type"] = "VIRAL_FRESH_TOKEN"
-                else:
-                    opp["alert_type"] = "TRENDING_NEW_TOKEN"
+                opp["alert_type"] = _ALERT_AGE_TYPES[
+                    bisect.bisect_left(_ALERT_AGE_BINS, opp.get("age_hours", 999))
+                ]
 
                 scored_opportunities.append(opp)
 
-            # Sort by combined score and limit results
-            scored_opportunities.sort(
-                key=lambda x: x.get("combined_score", 0), reverse=True
+            # Take the top results by combined score
+            final_results = heapq.nlargest(
+                max_results,
+                scored_opportunities,
+                key=lambda x: x.get("combined_score", 0),
             )
-            final_results = scored_opportunities[:max_results]
 
             scan_time = (datetime.now() - start_time).total_seconds()
             logger.info(
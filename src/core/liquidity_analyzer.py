@@ -1,6 +1,32 @@
 import logging
 from typing import Dict, Optional
 
+_NO_LIMIT = float("inf")
+_NO_MIN = float("-inf")
+
+# Alert type rules, checked in order - first match wins (prioritize freshness)
+# (max_age_hours, min_vol_to_liq, min_volume, opportunity_above, alert_type)
+_ALERT_TYPE_RULES = (
+    (1, _NO_MIN, _NO_MIN, _NO_MIN, "BRAND_NEW_LAUNCH"),
+    (6, 2.0, _NO_MIN, _NO_MIN, "VIRAL_FRESH_TOKEN"),
+    (12, _NO_MIN, 10000, _NO_MIN, "TRENDING_NEW_TOKEN"),
+    (24, _NO_MIN, _NO_MIN, _NO_MIN, "FRESH_LAUNCH"),
+    (48, _NO_MIN, _NO_MIN, 0.6, "RECENT_OPPORTUNITY"),
+    (_NO_LIMIT, 5.0, _NO_MIN, _NO_MIN, "HIGH_MOMENTUM_TOKEN"),
+    (_NO_LIMIT, _NO_MIN, 50000, _NO_MIN, "HIGH_VOLUME_OPPORTUNITY"),
+)
+
+# Highlight key sniffer metrics
+_REASONING_TMPL = (
+    "{fl} ({age}), ${liq} liq, ${vol} vol, {vtl:.1f}x turnover, "
+    "{txns} txns, {pc:+.1f}% 24h, {ml} momentum"
+)
+
+
+def _fmt_usd(amount: float) -> str:
+    """Whole-dollar amount with thousands separators"""
+    return "{:,}".format(round(amount))
+
 
 class LiquidityAnalyzer:
     """TOKEN SNIFFER - finds FRESH opportunities with high growth potential"""
@@ -16,8 +42,11 @@ class LiquidityAnalyzer:
     async def analyze_pair(self, pair_data: Dict) -> Optional[Dict]:
         """Analyze pairs - prioritize FRESH tokens with growth potential"""
         try:
-            liquidity = pair_data["total_liquidity_usd"]
-            volume = pair_data["volume_24h_usd"]
+            if not pair_data.get("pair_address"):
+                return None
+
+            liquidity = pair_data.get("total_liquidity_usd", 0)
+            volume = pair_data.get("volume_24h_usd", 0)
             age_hours = pair_data.get("age_hours")
 
             # Basic filters - very permissive for fresh tokens
@@ -30,11 +59,10 @@ class LiquidityAnalyzer:
             if age_hours is not None and age_hours > self.max_age_hours:
                 return None
 
-            # Calculate scores with freshness bias
-            opportunity_score = self._calculate_opportunity_score(pair_data)
-            safety_score = self._calculate_safety_score(pair_data)
-            momentum_score = self._calculate_momentum_score(pair_data)
+            # Cheapest discriminators first: freshness and opportunity alone decide
+            # acceptance, so safety/momentum are only scored for accepted pairs
             freshness_score = self._calculate_freshness_score(pair_data)
+            opportunity_score = self._calculate_opportunity_score(pair_data)
 
             # Apply freshness multiplier to opportunity score
             if age_hours is not None and age_hours <= 24:
@@ -42,44 +70,38 @@ class LiquidityAnalyzer:
 
             # Accept based on combined fresh + opportunity potential
             combined_score = (opportunity_score + freshness_score) / 2
-            if combined_score >= self.min_confidence_score:
-                alert_type = self._determine_alert_type(
-                    pair_data, opportunity_score, safety_score
-                )
-
-                return {
-                    "pair_address": pair_data["pair_address"],
-                    "alert_type": alert_type,
-                    "opportunity_score": min(opportunity_score, 1.0),  # Cap at 1.0
-                    "safety_score": safety_score,
-                    "momentum_score": momentum_score,
-                    "freshness_score": freshness_score,
-                    "combined_score": combined_score,
-                    "liquidity_usd": liquidity,
-                    "volume_24h_usd": volume,
-                    "base_symbol": pair_data["base_symbol"],
-                    "quote_symbol": pair_data["quote_symbol"],
-                    "dex_name": pair_data["dex_name"],
-                    "price_usd": pair_data["price_usd"],
-                    "market_cap_usd": pair_data["market_cap_usd"],
-                    "txns_24h": pair_data["txns_24h"],
-                    "age_hours": pair_data.get("age_hours"),
-                    "volume_to_liquidity_ratio": pair_data.get(
-                        "volume_to_liquidity_ratio", 0
-                    ),
-                    "price_change_24h": pair_data["price_change_24h"],
-                    "reasoning": self._generate_reasoning(
-                        pair_data,
-                        opportunity_score,
-                        safety_score,
-                        momentum_score,
-                        freshness_score,
-                    ),
-                }
-
-            return None
+            if combined_score < self.min_confidence_score:
+                return None
 
-        except Exception as e:
+            safety_score = self._calculate_safety_score(pair_data)
+            momentum_score = self._calculate_momentum_score(pair_data)
+            alert_type = self._determine_alert_type(
+                pair_data, opportunity_score, safety_score
+            )
+
+            # pair_data is consumed once by callers, so annotate it in place
+            # rather than copying every field into a new result dict
+            pair_data.update(
+                alert_type=alert_type,
+                opportunity_score=min(opportunity_score, 1.0),  # Cap at 1.0
+                safety_score=safety_score,
+                momentum_score=momentum_score,
+                freshness_score=freshness_score,
+                combined_score=combined_score,
+                liquidity_usd=liquidity,
+                reasoning=self._generate_reasoning(
+                    pair_data,
+                    opportunity_score,
+                    safety_score,
+                    momentum_score,
+                    freshness_score,
+                ),
+            )
+            pair_data.setdefault("volume_to_liquidity_ratio", 0)
+            return pair_data
+
+        except (TypeError, ValueError):
+            # Malformed numeric fields only cost this pair, not the scan
             return None
 
     def _calculate_opportunity_score(self, pair_data: Dict) -> float:
@@ -87,7 +109,7 @@ class LiquidityAnalyzer:
         score = 0.0
 
         # Liquidity score (0-0.2) - Lower weight, focus on growth range
-        liquidity = pair_data["total_liquidity_usd"]
+        liquidity = pair_data.get("total_liquidity_usd", 0)
         if liquidity >= 100000:  # $100k+ (good for fresh tokens)
             score += 0.2
         elif liquidity >= 50000:  # $50k+ (growing)
@@ -102,7 +124,7 @@ class LiquidityAnalyzer:
             score += 0.05
 
         # Volume score (0-0.3) - Higher weight for volume activity
-        volume = pair_data["volume_24h_usd"]
+        volume = pair_data.get("volume_24h_usd", 0)
         if volume >= 500000:  # $500k+ (viral)
             score += 0.3
         elif volume >= 100000:  # $100k+ (trending)
@@ -119,7 +141,7 @@ class LiquidityAnalyzer:
             score += 0.05
 
         # Activity score (0-0.25) - Higher weight for transaction activity
-        txns = pair_data["txns_24h"]
+        txns = pair_data.get("txns_24h", 0)
         if txns >= 500:
             score += 0.25
         elif txns >= 200:
@@ -153,7 +175,7 @@ class LiquidityAnalyzer:
         score = 0.0
 
         # Liquidity safety (0-0.4) - Lower thresholds for fresh tokens
-        liquidity = pair_data["total_liquidity_usd"]
+        liquidity = pair_data.get("total_liquidity_usd", 0)
         if liquidity >= 100000:  # $100k+ (safe for fresh)
             score += 0.4
         elif liquidity >= 50000:  # $50k+ (decent)
@@ -168,7 +190,7 @@ class LiquidityAnalyzer:
             score += 0.05
 
         # Volume consistency (0-0.3) - Regular activity is safer
-        volume = pair_data["volume_24h_usd"]
+        volume = pair_data.get("volume_24h_usd", 0)
         if volume >= 100000:
             score += 0.3
         elif volume >= 50000:
@@ -181,7 +203,7 @@ class LiquidityAnalyzer:
             score += 0.1
 
         # Transaction spread (0-0.3) - More transactions = more distributed
-        txns = pair_data["txns_24h"]
+        txns = pair_data.get("txns_24h", 0)
         if txns >= 200:
             score += 0.3
         elif txns >= 100:
@@ -202,7 +224,7 @@ class LiquidityAnalyzer:
         score = 0.0
 
         # Price change momentum
-        price_change = pair_data["price_change_24h"]
+        price_change = pair_data.get("price_change_24h", 0)
         if price_change > 100:  # 100%+ gain
             score += 0.5
         elif price_change > 50:  # 50%+ gain
@@ -261,7 +283,7 @@ class LiquidityAnalyzer:
 
         # Momentum bonus for very new tokens with activity
         if age_hours <= 12:
-            volume = pair_data["volume_24h_usd"]
+            volume = pair_data.get("volume_24h_usd", 0)
             if volume >= 10000:  # Good volume for new token
                 score += 0.2
             elif volume >= 1000:  # Decent volume
@@ -273,28 +295,28 @@ class LiquidityAnalyzer:
         self, pair_data: Dict, opportunity: float, safety: float
     ) -> str:
         """Determine alert type based on scores - prioritize freshness"""
-        age_hours = pair_data.get("age_hours", 999)
-        liquidity = pair_data["total_liquidity_usd"]
-        volume = pair_data["volume_24h_usd"]
+        age_hours = pair_data.get("age_hours")
+        if age_hours is None:
+            age_hours = 999
+        volume = pair_data.get("volume_24h_usd", 0)
         vol_to_liq = pair_data.get("volume_to_liquidity_ratio", 0)
 
-        # Prioritize by freshness and activity
-        if age_hours <= 1:
-            return "BRAND_NEW_LAUNCH"
-        elif age_hours <= 6 and vol_to_liq >= 2.0:
-            return "VIRAL_FRESH_TOKEN"
-        elif age_hours <= 12 and volume >= 10000:
-            return "TRENDING_NEW_TOKEN"
-        elif age_hours <= 24:
-            return "FRESH_LAUNCH"
-        elif age_hours <= 48 and opportunity > 0.6:
-            return "RECENT_OPPORTUNITY"
-        elif vol_to_liq >= 5.0:
-            return "HIGH_MOMENTUM_TOKEN"
-        elif volume >= 50000:
-            return "HIGH_VOLUME_OPPORTUNITY"
-        else:
-            return "EMERGING_OPPORTUNITY"
+        for (
+            max_age,
+            min_vol_to_liq,
+            min_volume,
+            min_opportunity,
+            alert_type,
+        ) in _ALERT_TYPE_RULES:
+            if (
+                age_hours <= max_age
+                and vol_to_liq >= min_vol_to_liq
+                and volume >= min_volume
+                and opportunity > min_opportunity
+            ):
+                return alert_type
+
+        return "EMERGING_OPPORTUNITY"
 
     def _generate_reasoning(
         self,
@@ -305,10 +327,10 @@ class LiquidityAnalyzer:
         freshness: float,
     ) -> str:
         """Generate detailed reasoning focused on freshness and growth"""
-        liquidity = pair_data["total_liquidity_usd"]
-        volume = pair_data["volume_24h_usd"]
-        txns = pair_data["txns_24h"]
-        price_change = pair_data["price_change_24h"]
+        liquidity = pair_data.get("total_liquidity_usd", 0)
+        volume = pair_data.get("volume_24h_usd", 0)
+        txns = pair_data.get("txns_24h", 0)
+        price_change = pair_data.get("price_change_24h", 0)
         age = pair_data.get("age_hours")
         vol_to_liq = pair_data.get("volume_to_liquidity_ratio", 0)
 
@@ -334,5 +356,15 @@ class LiquidityAnalyzer:
 
         age_str = f"{age:.1f}h old" if age is not None else "age unknown"
 
-        # Highlight key sniffer metrics
-        return f"{freshness_level} ({age_str}), ${liquidity:,.0f} liq, ${volume:,.0f} vol, {vol_to_liq:.1f}x turnover, {txns} txns, {price_change:+.1f}% 24h, {momentum_level} momentum"
+        return _REASONING_TMPL.format_map(
+            {
+                "fl": freshness_level,
+                "age": age_str,
+                "liq": _fmt_usd(liquidity),
+                "vol": _fmt_usd(volume),
+                "vtl": vol_to_liq,
+                "txns": txns,
+                "pc": price_change,
+                "ml": momentum_level,
+            }
+        )
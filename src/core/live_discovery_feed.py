@@ -4,14 +4,171 @@ Focused on finding MORE fresh opportunities with moderate criteria
 Less strict than gem hunter - quantity of fresh discoveries
 """
 import asyncio
+import bisect
+import heapq
+import itertools
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# DexScreener search results only refresh every 30-60s
+RESPONSE_CACHE_TTL_SECONDS = 30
+RESPONSE_CACHE_MAX_ENTRIES = 64
+
+# Transient failures (network errors, 429, 5xx) are retried with exponential
+# backoff; endpoints that keep failing are skipped until the cooldown expires
+FETCH_MAX_ATTEMPTS = 3
+FETCH_RETRY_BASE_DELAY_SECONDS = 0.25
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = 60
+
+# Cap in-flight requests so the HTTP/2 connection stays under the server's
+# concurrent stream limit and bursts don't trigger 429s
+MAX_CONCURRENT_FETCHES = 8
+
+# Discovery score bands, looked up with bisect instead of if/elif chains
+_AGE_BINS = (0.5, 2, 6, 12, 24)  # hours, inclusive upper bounds
+_AGE_POINTS = (4.0, 3.5, 3.0, 2.5, 2.0, 0)
+_ACTIVITY_BINS = (50, 100, 150, 300)  # volume spike %, inclusive lower bounds
+_ACTIVITY_POINTS = (1.0, 1.5, 2.0, 2.5, 3.0)  # any positive activity scores 1.0
+_LIQUIDITY_BINS = (1000, 5000, 10000)  # USD, inclusive lower bounds
+_LIQUIDITY_POINTS = (0, 1.0, 1.5, 2.0)
+_PRICE_CHANGE_BINS = (0, 20)  # % 24h, exclusive lower bounds
+_PRICE_CHANGE_POINTS = (0, 0.5, 1.0)
+_DISCOVERY_TYPE_BINS = (4, 6, 8)  # discovery score, inclusive lower bounds
+_DISCOVERY_TYPES = ("RECENT_LAUNCH", "NEW_OPPORTUNITY", "FRESH_FIND", "HOT_DISCOVERY")
+
+_DEXSCREENER_SEARCH_URL = "https://api.dexscreener.com/latest/dex/search/?q="
+
+_ANY_AGE = float("inf")
+
+# Discovery strategies in priority order:
+# (source, log label, endpoints, pairs checked per endpoint,
+#  (max_age_hours, min_liquidity_usd, min_volume_spike_percent) filter)
+_STRATEGIES = (
+    # Strategy 1: Recent Solana tokens (most active)
+    (
+        "recent_solana",
+        "📊 Recent Solana",
+        (
+            _DEXSCREENER_SEARCH_URL + "SOL&orderBy=h24Volume",
+            _DEXSCREENER_SEARCH_URL + "new",
+            _DEXSCREENER_SEARCH_URL + "launched",
+        ),
+        30,
+        (12.0, 0.0, 0.0),  # Recent: < 12 hours
+    ),
+    # Strategy 2: Fresh pump.fun style tokens
+    (
+        "pump_style",
+        "🚀 Pump Style",
+        (
+            _DEXSCREENER_SEARCH_URL + "pump",
+            _DEXSCREENER_SEARCH_URL + "meme",
+            _DEXSCREENER_SEARCH_URL + "fair",
+        ),
+        20,
+        (6.0, 0.0, 0.0),  # Fresh: < 6 hours
+    ),
+    # Strategy 3: New DEX listings
+    (
+        "dex_listing",
+        "🏭 DEX Listings",
+        (
+            _DEXSCREENER_SEARCH_URL + "raydium",
+            _DEXSCREENER_SEARCH_URL + "orca",
+            _DEXSCREENER_SEARCH_URL + "meteora",
+        ),
+        15,
+        (24.0, 500.0, 0.0),  # Viable: < 24 hours + basic liquidity
+    ),
+    # Strategy 4: Trending searches
+    (
+        "trending",
+        "📈 Trending",
+        (
+            _DEXSCREENER_SEARCH_URL + "trending",
+            _DEXSCREENER_SEARCH_URL + "volume",
+            _DEXSCREENER_SEARCH_URL + "active",
+        ),
+        10,
+        (_ANY_AGE, 0.0, 50.0),  # Any positive activity
+    ),
+)
+
+
+def _is_transient_failure(response: Optional[httpx.Response]) -> bool:
+    """True for failed fetches worth retrying: network errors, 429 and 5xx"""
+    if response is None:
+        return True
+    return response.status_code == 429 or response.status_code >= 500
+
+
+@dataclass(slots=True)
+class Discovery:
+    """Fixed-layout discovery record used while filtering and scoring a scan"""
+
+    pair_address: str
+    base_token: str
+    quote_token: str
+    base_symbol: str
+    quote_symbol: str
+    dex_name: str
+    liquidity_usd: float
+    volume_24h_usd: float
+    volume_1h_usd: float
+    market_cap_usd: float
+    price_usd: float
+    price_change_24h: float
+    age_hours: float
+    volume_spike_percent: float
+    source: str
+    discovered_at: str
+    discovery_score: float = 0.0
+    discovery_type: str = ""
+
+    @property
+    def total_liquidity_usd(self) -> float:
+        """Alias of liquidity_usd for consumers of the analyzer field name"""
+        return self.liquidity_usd
+
+    @property
+    def url(self) -> str:
+        """DexScreener page, built only when a discovery is actually emitted"""
+        return f"https://dexscreener.com/solana/{self.pair_address}"
+
+    def to_dict(self) -> Dict:
+        """Discovery dict in the format the bots consume"""
+        return {
+            "pair_address": self.pair_address,
+            "base_token": self.base_token,
+            "quote_token": self.quote_token,
+            "base_symbol": self.base_symbol,
+            "quote_symbol": self.quote_symbol,
+            "dex_name": self.dex_name,
+            "total_liquidity_usd": self.total_liquidity_usd,
+            "liquidity_usd": self.liquidity_usd,
+            "volume_24h_usd": self.volume_24h_usd,
+            "volume_1h_usd": self.volume_1h_usd,
+            "market_cap_usd": self.market_cap_usd,
+            "price_usd": self.price_usd,
+            "price_change_24h": self.price_change_24h,
+            "age_hours": self.age_hours,
+            "volume_spike_percent": self.volume_spike_percent,
+            "source": self.source,
+            "url": self.url,
+            "discovered_at": self.discovered_at,
+            "discovery_score": self.discovery_score,
+            "discovery_type": self.discovery_type,
+        }
+
 
 class LiveDiscoveryScanner:
     """
@@ -21,10 +178,21 @@ class LiveDiscoveryScanner:
     - Volume Spike: ≥ 100% (vs 200% for gems)
     - Market Cap: $1k - $1M range (vs $5k-500k for gems)
     - Focus: MORE opportunities, recent discoveries
+
+    Usable as an async context manager to guarantee the HTTP client is closed:
+
+        async with LiveDiscoveryScanner() as scanner:
+            discoveries = await scanner.scan_live_discoveries()
     """
 
     def __init__(self):
-        self.http_client = httpx.AsyncClient(timeout=20.0)
+        # Created lazily on first request so constructing a scanner is cheap
+        self.http_client: Optional[httpx.AsyncClient] = None
+        # url -> (fetched_at monotonic seconds, decoded JSON body)
+        self._cache: Dict[str, Tuple[float, Dict]] = {}
+        # url -> (consecutive failed fetches, skip until monotonic seconds)
+        self._failures: Dict[str, Tuple[int, float]] = {}
+        self._fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
         self.discovery_criteria = {
             "max_age_hours": 24,  # 24h vs 72h for gems
             "min_liquidity_usd": 1000,  # $1k vs $2k for gems
@@ -33,6 +201,29 @@ class LiveDiscoveryScanner:
             "max_market_cap": 1000000,  # $1M vs $500k for gems
         }
 
+    async def __aenter__(self) -> "LiveDiscoveryScanner":
+        self._get_http_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client, creating it on first use"""
+        if self.http_client is None or self.http_client.is_closed:
+            # All endpoints share one host, so HTTP/2 multiplexes the
+            # concurrent strategy fetches over a single connection
+            self.http_client = httpx.AsyncClient(
+                timeout=20.0,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60.0,
+                ),
+            )
+        return self.http_client
+
     async def scan_live_discoveries(self, max_discoveries: int = 15) -> List[Dict]:
         """
         Scan for live fresh discoveries with moderate criteria
@@ -45,199 +236,164 @@ class LiveDiscoveryScanner:
         all_discoveries = []
 
         try:
-            # Strategy 1: Recent Solana tokens (most active)
-            recent_tokens = await self._scan_recent_solana_tokens(max_discoveries)
-            all_discoveries.extend(recent_tokens)
-            logger.info(f"📊 Recent Solana: Found {len(recent_tokens)} discoveries")
-
-            # Strategy 2: Fresh pump.fun style tokens
-            if len(all_discoveries) < max_discoveries:
-                pump_tokens = await self._scan_fresh_pump_tokens(
-                    max_discoveries - len(all_discoveries)
-                )
-                all_discoveries.extend(pump_tokens)
-                logger.info(f"🚀 Pump Style: Found {len(pump_tokens)} discoveries")
-
-            # Strategy 3: New DEX listings
-            if len(all_discoveries) < max_discoveries:
-                dex_tokens = await self._scan_new_dex_listings(
-                    max_discoveries - len(all_discoveries)
+            # Fetch every endpoint of every strategy concurrently
+            results = iter(
+                await asyncio.gather(
+                    *(
+                        self._fetch_pairs(endpoint, source, pair_limit)
+                        for source, _, endpoints, pair_limit, _ in _STRATEGIES
+                        for endpoint in endpoints
+                    )
                 )
-                all_discoveries.extend(dex_tokens)
-                logger.info(f"🏭 DEX Listings: Found {len(dex_tokens)} discoveries")
+            )
 
-            # Strategy 4: Trending searches
-            if len(all_discoveries) < max_discoveries:
-                trending_tokens = await self._scan_trending_tokens(
-                    max_discoveries - len(all_discoveries)
-                )
-                all_discoveries.extend(trending_tokens)
-                logger.info(f"📈 Trending: Found {len(trending_tokens)} discoveries")
+            # One timestamp for the whole scan
+            now_ms = int(time.time() * 1000)
+            discovered_at = datetime.now().isoformat()
+
+            # Parse in strategy priority order - earlier strategies fill first.
+            # A pair is deduplicated only once a strategy accepts it, so a pair
+            # rejected by a narrow strategy can still pass a wider later one.
+            # Parses are cached so a pair returned by several searches is
+            # only parsed and scored once.
+            seen_addresses = set()
+            parsed_by_address = {}  # pair address -> Discovery or None
+            for source, label, endpoints, _, strategy_filter in _STRATEGIES:
+                max_age, min_liquidity, min_activity = strategy_filter
+                quota = max_discoveries - len(all_discoveries)
+                batches = [next(results) for _ in endpoints]
+
+                found = []
+                for pair in itertools.chain.from_iterable(batches):
+                    if len(found) >= quota:
+                        break
+
+                    address = pair.get("pairAddress")
+                    if not address or address in seen_addresses:
+                        continue
+
+                    if address in parsed_by_address:
+                        discovery = parsed_by_address[address]
+                    else:
+                        discovery = self._parse_discovery(
+                            pair, source, now_ms, discovered_at
+                        )
+                        parsed_by_address[address] = discovery
+
+                    if discovery is None or (
+                        discovery.age_hours > max_age
+                        or discovery.liquidity_usd < min_liquidity
+                        or discovery.volume_spike_percent < min_activity
+                    ):
+                        continue
+
+                    # Credit the strategy that accepted it, not the first parser
+                    discovery.source = source
+                    seen_addresses.add(address)
+                    found.append(discovery)
+
+                all_discoveries.extend(found)
+                logger.info(f"{label}: Found {len(found)} discoveries")
 
-            # Remove duplicates and filter
-            unique_discoveries = self._deduplicate_discoveries(all_discoveries)
             filtered_discoveries = [
-                d for d in unique_discoveries if self._meets_discovery_criteria(d)
+                d for d in all_discoveries if self._meets_discovery_criteria(d)
             ]
 
-            # Sort by discovery score (freshness + activity)
-            filtered_discoveries.sort(
-                key=lambda x: x.get("discovery_score", 0), reverse=True
+            # Top discoveries by score (freshness + activity)
+            final_discoveries = heapq.nlargest(
+                max_discoveries,
+                filtered_discoveries,
+                key=lambda x: x.discovery_score,
             )
 
-            final_discoveries = filtered_discoveries[:max_discoveries]
-
             logger.info(
                 f"🚀 Live discovery scan complete: {len(final_discoveries)} fresh discoveries found"
             )
-            return final_discoveries
+            return [d.to_dict() for d in final_discoveries]
 
         except Exception as e:
             logger.error(f"Live discovery scan error: {e}")
             return []
 
-    async def _scan_recent_solana_tokens(self, max_tokens: int) -> List[Dict]:
-        """Scan for recently created Solana tokens"""
-        discoveries = []
-
-        try:
-            # Multiple endpoints for fresh token discovery
-            endpoints = [
-                "https://api.dexscreener.com/latest/dex/search/?q=SOL&orderBy=h24Volume",
-                "https://api.dexscreener.com/latest/dex/search/?q=new",
-                "https://api.dexscreener.com/latest/dex/search/?q=launched",
-            ]
-
-            for endpoint in endpoints:
-                try:
-                    response = await self.http_client.get(endpoint)
-                    if response.status_code == 200:
-                        data = response.json()
-                        pairs = data.get("pairs", [])
-
-                        for pair in pairs[:30]:  # Check first 30 from each
-                            discovery = self._parse_discovery(pair, "recent_solana")
-                            if discovery and self._is_recent_discovery(discovery):
-                                discoveries.append(discovery)
-
-                                if len(discoveries) >= max_tokens:
-                                    return discoveries
-                except Exception as e:
-                    logger.warning(f"Recent Solana endpoint error: {e}")
-                    continue
-
-        except Exception as e:
-            logger.error(f"Recent Solana scan error: {e}")
-
-        return discoveries
-
-    async def _scan_fresh_pump_tokens(self, max_tokens: int) -> List[Dict]:
-        """Scan for fresh pump.fun style tokens"""
-        discoveries = []
-
-        try:
-            # Pump.fun and similar platforms
-            endpoints = [
-                "https://api.dexscreener.com/latest/dex/search/?q=pump",
-                "https://api.dexscreener.com/latest/dex/search/?q=meme",
-                "https://api.dexscreener.com/latest/dex/search/?q=fair",
-            ]
-
-            for endpoint in endpoints:
-                try:
-                    response = await self.http_client.get(endpoint)
-                    if response.status_code == 200:
-                        data = response.json()
-                        pairs = data.get("pairs", [])
-
-                        for pair in pairs[:20]:
-                            discovery = self._parse_discovery(pair, "pump_style")
-                            if discovery and self._is_fresh_discovery(discovery):
-                                discoveries.append(discovery)
-
-                                if len(discoveries) >= max_tokens:
-                                    return discoveries
-                except Exception as e:
-                    logger.warning(f"Pump style endpoint error: {e}")
-                    continue
-
-        except Exception as e:
-            logger.error(f"Pump style scan error: {e}")
-
-        return discoveries
-
-    async def _scan_new_dex_listings(self, max_tokens: int) -> List[Dict]:
-        """Scan for new DEX listings"""
-        discoveries = []
-
+    async def _fetch_pairs(
+        self, endpoint: str, source: str, pair_limit: int
+    ) -> List[Dict]:
+        """Fetch one endpoint and return its first pair_limit raw pairs"""
         try:
-            # Focus on different DEXs for variety
-            endpoints = [
-                "https://api.dexscreener.com/latest/dex/search/?q=raydium",
-                "https://api.dexscreener.com/latest/dex/search/?q=orca",
-                "https://api.dexscreener.com/latest/dex/search/?q=meteora",
-            ]
-
-            for endpoint in endpoints:
-                try:
-                    response = await self.http_client.get(endpoint)
-                    if response.status_code == 200:
-                        data = response.json()
-                        pairs = data.get("pairs", [])
-
-                        for pair in pairs[:15]:
-                            discovery = self._parse_discovery(pair, "dex_listing")
-                            if discovery and self._is_viable_discovery(discovery):
-                                discoveries.append(discovery)
-
-                                if len(discoveries) >= max_tokens:
-                                    return discoveries
-                except Exception as e:
-                    logger.warning(f"DEX listing endpoint error: {e}")
-                    continue
-
+            data = await self._cached_get(endpoint, max_pairs=pair_limit)
+            if data is not None:
+                return data["pairs"]
         except Exception as e:
-            logger.error(f"DEX listing scan error: {e}")
-
-        return discoveries
-
-    async def _scan_trending_tokens(self, max_tokens: int) -> List[Dict]:
-        """Scan for trending tokens with recent activity"""
-        discoveries = []
+            logger.warning(f"{source} endpoint error: {e}")
 
-        try:
-            # Focus on trending/active tokens
-            endpoints = [
-                "https://api.dexscreener.com/latest/dex/search/?q=trending",
-                "https://api.dexscreener.com/latest/dex/search/?q=volume",
-                "https://api.dexscreener.com/latest/dex/search/?q=active",
-            ]
+        return []
 
-            for endpoint in endpoints:
-                try:
-                    response = await self.http_client.get(endpoint)
-                    if response.status_code == 200:
-                        data = response.json()
-                        pairs = data.get("pairs", [])
-
-                        for pair in pairs[:10]:
-                            discovery = self._parse_discovery(pair, "trending")
-                            if discovery and self._has_recent_activity(discovery):
-                                discoveries.append(discovery)
+    async def _cached_get(
+        self,
+        url: str,
+        ttl: float = RESPONSE_CACHE_TTL_SECONDS,
+        max_pairs: Optional[int] = None,
+    ) -> Optional[Dict]:
+        """
+        GET a JSON endpoint, reusing the decoded body for ttl seconds
+        With max_pairs, only the first max_pairs pairs are kept, so the rest
+        of a large response is freed right after decoding instead of cached
+        """
+        now = time.monotonic()
+        cached = self._cache.get(url)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
 
-                                if len(discoveries) >= max_tokens:
-                                    return discoveries
-                except Exception as e:
-                    logger.warning(f"Trending endpoint error: {e}")
-                    continue
+        failures, skip_until = self._failures.get(url, (0, 0.0))
+        if failures >= CIRCUIT_BREAKER_THRESHOLD and now < skip_until:
+            return None
 
-        except Exception as e:
-            logger.error(f"Trending scan error: {e}")
+        response = None
+        for attempt in range(FETCH_MAX_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(FETCH_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1))
+            try:
+                async with self._fetch_semaphore:
+                    response = await self._get_http_client().get(url)
+            except httpx.TransportError as e:
+                logger.debug(f"Fetch attempt {attempt + 1} failed for {url}: {e}")
+                response = None
+                continue
+            if not _is_transient_failure(response):
+                break
+
+        if _is_transient_failure(response):
+            failures += 1
+            self._failures[url] = (
+                failures,
+                time.monotonic() + CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+            )
+            if failures == CIRCUIT_BREAKER_THRESHOLD:
+                logger.warning(
+                    f"Skipping {url} for {CIRCUIT_BREAKER_COOLDOWN_SECONDS}s "
+                    f"after {failures} failed fetches"
+                )
+            return None
 
-        return discoveries
+        self._failures.pop(url, None)
+        if response.status_code != 200:
+            return None
 
-    def _parse_discovery(self, pair: Dict, source: str) -> Optional[Dict]:
-        """Parse pair data into discovery format"""
+        data = orjson.loads(response.content)
+        if max_pairs is not None:
+            data = {"pairs": (data.get("pairs") or [])[:max_pairs]}
+
+        self._cache.pop(url, None)
+        if len(self._cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[url] = (now, data)
+        return data
+
+    def _parse_discovery(
+        self, pair: Dict, source: str, now_ms: int, discovered_at: str
+    ) -> Optional[Discovery]:
+        """Parse pair data into a Discovery as of the batch time now_ms (epoch ms)"""
         try:
             if not pair.get("baseToken") or not pair.get("quoteToken"):
                 return None
@@ -246,16 +402,30 @@ class LiveDiscoveryScanner:
             quote_token = pair["quoteToken"]
 
             # Calculate age
-            age_hours = 999
-            if pair.get("pairCreatedAt"):
-                created_time = datetime.fromtimestamp(pair["pairCreatedAt"] / 1000)
-                age_hours = (datetime.now() - created_time).total_seconds() / 3600
+            created_ms = pair.get("pairCreatedAt")
+            age_hours = (now_ms - created_ms) / 3_600_000 if created_ms else 999
 
             # Get financial metrics
             liquidity_usd = float(pair.get("liquidity", {}).get("usd", 0) or 0)
+            market_cap = float(pair.get("marketCap", 0) or 0)
+
+            # Cheap rejects before building the discovery - these pairs can
+            # never pass _meets_discovery_criteria
+            criteria = self.discovery_criteria
+            if (
+                age_hours > criteria["max_age_hours"]
+                or liquidity_usd < criteria["min_liquidity_usd"]
+                or (
+                    market_cap > 0
+                    and not criteria["min_market_cap"]
+                    <= market_cap
+                    <= criteria["max_market_cap"]
+                )
+            ):
+                return None
+
             volume_24h = float(pair.get("volume", {}).get("h24", 0) or 0)
             volume_1h = float(pair.get("volume", {}).get("h1", 0) or 0)
-            market_cap = float(pair.get("marketCap", 0) or 0)
             price_change_24h = float(pair.get("priceChange", {}).get("h24", 0) or 0)
 
             # Calculate volume spike (less strict than gems)
@@ -263,29 +433,27 @@ class LiveDiscoveryScanner:
                 volume_1h, volume_24h, age_hours
             )
 
-            discovery = {
-                "pair_address": pair.get("pairAddress", ""),
-                "base_token": base_token.get("address", ""),
-                "quote_token": quote_token.get("address", ""),
-                "base_symbol": base_token.get("symbol", "UNKNOWN"),
-                "quote_symbol": quote_token.get("symbol", "SOL"),
-                "dex_name": pair.get("dexId", "unknown"),
-                "total_liquidity_usd": liquidity_usd,
-                "liquidity_usd": liquidity_usd,
-                "volume_24h_usd": volume_24h,
-                "volume_1h_usd": volume_1h,
-                "market_cap_usd": market_cap,
-                "price_usd": float(pair.get("priceUsd", 0) or 0),
-                "price_change_24h": price_change_24h,
-                "age_hours": age_hours,
-                "volume_spike_percent": volume_spike,
-                "source": source,
-                "url": f"https://dexscreener.com/solana/{pair.get('pairAddress', '')}",
-                "discovered_at": datetime.now().isoformat(),
-            }
+            discovery = Discovery(
+                pair_address=pair.get("pairAddress", ""),
+                base_token=base_token.get("address", ""),
+                quote_token=quote_token.get("address", ""),
+                base_symbol=base_token.get("symbol", "UNKNOWN"),
+                quote_symbol=quote_token.get("symbol", "SOL"),
+                dex_name=pair.get("dexId", "unknown"),
+                liquidity_usd=liquidity_usd,
+                volume_24h_usd=volume_24h,
+                volume_1h_usd=volume_1h,
+                market_cap_usd=market_cap,
+                price_usd=float(pair.get("priceUsd", 0) or 0),
+                price_change_24h=price_change_24h,
+                age_hours=age_hours,
+                volume_spike_percent=volume_spike,
+                source=source,
+                discovered_at=discovered_at,
+            )
 
             # Calculate discovery score (freshness + activity focus)
-            discovery["discovery_score"] = self._calculate_discovery_score(discovery)
+            discovery.discovery_score = self._calculate_discovery_score(discovery)
 
             return discovery
 
@@ -315,101 +483,54 @@ class LiveDiscoveryScanner:
         except Exception:
             return 0
 
-    def _calculate_discovery_score(self, discovery: Dict) -> float:
+    def _calculate_discovery_score(self, discovery: Discovery) -> float:
         """Calculate discovery score focusing on freshness and activity"""
         try:
-            score = 0
-
             # Freshness score (0-4 points) - higher weight for recency
-            age_hours = discovery.get("age_hours", 999)
-            if age_hours <= 0.5:  # 30 minutes
-                score += 4.0
-            elif age_hours <= 2:  # 2 hours
-                score += 3.5
-            elif age_hours <= 6:  # 6 hours
-                score += 3.0
-            elif age_hours <= 12:  # 12 hours
-                score += 2.5
-            elif age_hours <= 24:  # 24 hours
-                score += 2.0
+            age_hours = discovery.age_hours
+            score = _AGE_POINTS[bisect.bisect_left(_AGE_BINS, age_hours)]
 
             # Activity score (0-3 points)
-            volume_activity = discovery.get("volume_spike_percent", 0)
-            if volume_activity >= 300:
-                score += 3.0
-            elif volume_activity >= 150:
-                score += 2.5
-            elif volume_activity >= 100:
-                score += 2.0
-            elif volume_activity >= 50:
-                score += 1.5
-            elif volume_activity > 0:
-                score += 1.0
+            volume_activity = discovery.volume_spike_percent
+            if volume_activity > 0:
+                score += _ACTIVITY_POINTS[
+                    bisect.bisect_right(_ACTIVITY_BINS, volume_activity)
+                ]
 
             # Liquidity score (0-2 points)
-            liquidity = discovery.get("liquidity_usd", 0)
-            if liquidity >= 10000:
-                score += 2.0
-            elif liquidity >= 5000:
-                score += 1.5
-            elif liquidity >= 1000:
-                score += 1.0
+            liquidity = discovery.liquidity_usd
+            score += _LIQUIDITY_POINTS[bisect.bisect_right(_LIQUIDITY_BINS, liquidity)]
 
             # Price momentum (0-1 point)
-            price_change = discovery.get("price_change_24h", 0)
-            if price_change > 20:
-                score += 1.0
-            elif price_change > 0:
-                score += 0.5
+            price_change = discovery.price_change_24h
+            score += _PRICE_CHANGE_POINTS[
+                bisect.bisect_left(_PRICE_CHANGE_BINS, price_change)
+            ]
 
             return round(score, 2)
 
         except Exception:
             return 0
 
-    def _is_recent_discovery(self, discovery: Dict) -> bool:
-        """Check if discovery is recent (< 12 hours)"""
-        age_hours = discovery.get("age_hours", 999)
-        return age_hours <= 12
-
-    def _is_fresh_discovery(self, discovery: Dict) -> bool:
-        """Check if discovery is fresh (< 6 hours)"""
-        age_hours = discovery.get("age_hours", 999)
-        return age_hours <= 6
-
-    def _is_viable_discovery(self, discovery: Dict) -> bool:
-        """Check if discovery is viable (< 24 hours + basic criteria)"""
-        age_hours = discovery.get("age_hours", 999)
-        liquidity = discovery.get("liquidity_usd", 0)
-        return age_hours <= 24 and liquidity >= 500
-
-    def _has_recent_activity(self, discovery: Dict) -> bool:
-        """Check if discovery has recent activity"""
-        volume_activity = discovery.get("volume_spike_percent", 0)
-        return volume_activity >= 50  # Any positive activity
-
-    def _meets_discovery_criteria(self, discovery: Dict) -> bool:
+    def _meets_discovery_criteria(self, discovery: Discovery) -> bool:
         """Check if discovery meets moderate criteria"""
         try:
             criteria = self.discovery_criteria
 
             # Age check (more lenient)
-            if discovery.get("age_hours", 999) > criteria["max_age_hours"]:
+            if discovery.age_hours > criteria["max_age_hours"]:
                 return False
 
             # Liquidity check (lower threshold)
-            if discovery.get("liquidity_usd", 0) < criteria["min_liquidity_usd"]:
+            if discovery.liquidity_usd < criteria["min_liquidity_usd"]:
                 return False
 
             # Activity check (lower threshold)
-            if (
-                discovery.get("volume_spike_percent", 0)
-                < criteria["min_volume_spike_percent"]
-            ):
+            if discovery.volume_spike_percent < criteria["min_volume_spike_percent"]:
                 return False
 
             # Market cap check (wider range)
-            mcap = discovery.get("market_cap_usd", 0)
+            mcap = discovery.market_cap_usd
             if mcap > 0:
                 if (
                     mcap < criteria["min_market_cap"]
@@ -418,37 +539,23 @@ class LiveDiscoveryScanner:
                     return False
 
             # Add discovery type based on score
-            discovery_score = discovery.get("discovery_score", 0)
-            if discovery_score >= 8:
-                discovery["discovery_type"] = "HOT_DISCOVERY"
-            elif discovery_score >= 6:
-                discovery["discovery_type"] = "FRESH_FIND"
-            elif discovery_score >= 4:
-                discovery["discovery_type"] = "NEW_OPPORTUNITY"
-            else:
-                discovery["discovery_type"] = "RECENT_LAUNCH"
+            discovery_score = discovery.discovery_score
+            discovery.discovery_type = _DISCOVERY_TYPES[
+                bisect.bisect_right(_DISCOVERY_TYPE_BINS, discovery_score)
+            ]
 
             return True
 
         except Exception:
             return False
 
-    def _deduplicate_discoveries(self, discoveries: List[Dict]) -> List[Dict]:
-        """Remove duplicate discoveries"""
-        seen_addresses = set()
-        unique_discoveries = []
-
-        for discovery in discoveries:
-            address = discovery.get("pair_address", "")
-            if address and address not in seen_addresses:
-                seen_addresses.add(address)
-                unique_discoveries.append(discovery)
-
-        return unique_discoveries
-
     async def close(self):
         """Close HTTP client"""
+        if self.http_client is None:
+            return
         try:
             await self.http_client.aclose()
         except Exception as e:
             logger.error(f"Error closing HTTP client: {e}")
+        finally:
+            self.http_client = None
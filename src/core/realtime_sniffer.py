@@ -3,21 +3,161 @@ Real-time blockchain monitoring for TRULY fresh token launches
 Monitors DEX factory contracts directly for new pair creation events
 """
 import asyncio
-import json
+import base64
+import functools
+import itertools
 import logging
-from datetime import datetime, timedelta
+import random
+import re
+import struct
+import time
+from datetime import datetime
 from typing import Callable, Dict, List, Optional
 
 import httpx
+import orjson
 import websockets
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.types import MemcmpOpts
-from solana.rpc.websocket_api import connect
+from solana.rpc.websocket_api import SubscriptionError, connect
+from solders.commitment_config import CommitmentLevel
 from solders.pubkey import Pubkey
+from solders.rpc.config import (
+    RpcAccountInfoConfig,
+    RpcTransactionLogsConfig,
+    RpcTransactionLogsFilterMentions,
+)
+from solders.rpc.requests import AccountSubscribe, LogsSubscribe
+from solders.rpc.responses import SubscriptionResult
 from solders.signature import Signature
 
 logger = logging.getLogger(__name__)
 
+# DEX factory program IDs monitored by the sniffers
+DEX_FACTORIES = {
+    "raydium": "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8",  # Raydium AMM
+    "orca": "9W959DqEETiGZocYWCQPaJ6sBmUzgfxXfqGeTEdp3aQP",  # Orca Whirlpool
+    "meteora": "Eo7WjKq67rjJQSZxS6z3YkapzY3eMj6Xy8X5EQVn5UaB",  # Meteora DLMM
+}
+
+# getSignaturesForAddress returns at most 1000 signatures per call
+SIGNATURE_PAGE_LIMIT = 1000
+
+# Signatures older than this many pages per DEX per poll are skipped (and
+# logged) so a burst can't make the poll loop fall further and further behind
+MAX_SIGNATURE_PAGES_PER_POLL = 5
+
+# Cap in-flight getTransaction calls across all DEXes so a busy factory's
+# signature page doesn't trip the public RPC's 429 rate limit
+MAX_CONCURRENT_TRANSACTION_FETCHES = 8
+
+# Largest websocket frame accepted from the RPC node (block-heavy log bursts)
+WS_MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+# Websocket keepalive pings; a missed pong closes the socket and reconnects
+WS_PING_INTERVAL_SECONDS = 20
+RECONNECT_BASE_DELAY_SECONDS = 1.0
+RECONNECT_MAX_DELAY_SECONDS = 30.0
+
+# getMultipleAccounts accepts up to 100 accounts per call
+RPC_ACCOUNTS_BATCH_SIZE = 100
+
+# Websocket events are handed to workers so the socket reader never blocks
+EVENT_QUEUE_SIZE = 4096
+EVENT_WORKERS = 4
+
+# DexScreener accepts up to 30 comma-separated pair addresses per request
+DEXSCREENER_PAIRS_URL = "https://api.dexscreener.com/latest/dex/pairs/solana/"
+DEXSCREENER_BATCH_SIZE = 30
+
+# Discovery times are stored as int epoch nanoseconds
+NS_PER_HOUR = 3_600_000_000_000
+FRESH_WINDOW_NS = 24 * NS_PER_HOUR
+RETENTION_NS = 48 * NS_PER_HOUR
+PAIR_DETAILS_TTL_NS = 60 * 1_000_000_000
+
+# Single case-insensitive alternation so each event is scanned once
+_PAIR_INDICATOR_RE = re.compile(
+    "initialize|create_pool|new_pair|liquidity|mint", re.IGNORECASE
+)
+
+# Raydium AMM v4 emits "ray_log: <base64>" when a pool is initialized. The
+# InitLog payload is log_type u8, open_time u64, pc/coin decimals u8, pc/coin
+# lot sizes u64, pc/coin amounts u64 and the OpenBook market pubkey
+_RAYDIUM_AMM_PROGRAM_ID = DEX_FACTORIES["raydium"]
+_RAYDIUM_RAY_LOG_PREFIX = "Program log: ray_log: "
+_RAYDIUM_INIT_LOG = struct.Struct("<BQBBQQQQ32s")
+_RAYDIUM_INIT_LOG_TYPE = 0
+_RAYDIUM_AMM_SEED = b"amm_associated_seed"
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """Create the HTTP client used for DexScreener lookups"""
+    # DexScreener lookups arrive in bursts of new pairs, so keep HTTP/2
+    # connections alive between them instead of re-handshaking TLS
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(5.0, connect=2.0),
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,  # connection-level retries only
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0,
+            ),
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=65536)
+def _pubkey(address: str) -> Pubkey:
+    """Parse a base58 address once and reuse the Pubkey afterwards"""
+    return Pubkey.from_string(address)
+
+
+def _event_logs(event_data) -> List[str]:
+    """Log lines of a successful logs notification, empty for other events"""
+    value = getattr(event_data, "value", None)
+    if getattr(value, "err", None) is not None:
+        return []
+    return getattr(value, "logs", None) or []
+
+
+def _raydium_pool_from_logs(logs: List[str]) -> Optional[str]:
+    """Derive a Raydium AMM pool address from its initialize ray_log"""
+    for line in logs:
+        if not line.startswith(_RAYDIUM_RAY_LOG_PREFIX):
+            continue
+
+        payload = base64.b64decode(line[len(_RAYDIUM_RAY_LOG_PREFIX) :])
+        if (
+            len(payload) != _RAYDIUM_INIT_LOG.size
+            or payload[0] != _RAYDIUM_INIT_LOG_TYPE
+        ):
+            continue
+
+        # Standard pools live at the PDA of (program, market, seed)
+        market = _RAYDIUM_INIT_LOG.unpack(payload)[-1]
+        program_key = _pubkey(_RAYDIUM_AMM_PROGRAM_ID)
+        pool_key, _ = Pubkey.find_program_address(
+            [bytes(program_key), market, _RAYDIUM_AMM_SEED], program_key
+        )
+        return str(pool_key)
+
+    return None
+
+
+# Pool decoders per DEX; MempoolSniffer only polls factories listed here,
+# since any other factory's transactions could never yield a pair
+_POOL_DECODERS: Dict[str, Callable[[List[str]], Optional[str]]] = {
+    "raydium": _raydium_pool_from_logs,
+}
+
+
+def _iso_from_ns(epoch_ns: int) -> str:
+    """Format an epoch-nanosecond timestamp as a naive UTC ISO-8601 string"""
+    return datetime.utcfromtimestamp(epoch_ns / 1e9).isoformat()
+
 
 class RealtimeTokenSniffer:
     """
@@ -29,26 +169,36 @@ class RealtimeTokenSniffer:
         self,
         rpc_url: str = "https://api.mainnet-beta.solana.com",
         wss_url: str = "wss://api.mainnet-beta.solana.com",
+        client: Optional[AsyncClient] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         self.rpc_url = rpc_url
         self.wss_url = wss_url
-        self.client = AsyncClient(rpc_url)
-        self.http_client = httpx.AsyncClient()
+
+        # Injected clients are shared with other sniffers and left open
+        self.owns_client = client is None
+        self.client = client or AsyncClient(rpc_url)
+        self.owns_http_client = http_client is None
+        self.http_client = http_client or _build_http_client()
 
         # DEX factory program IDs we'll monitor
-        self.dex_factories = {
-            "raydium": "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8",  # Raydium AMM
-            "orca": "9W959DqEETiGZocYWCQPaJ6sBmUzgfxXfqGeTEdp3aQP",  # Orca Whirlpool
-            "meteora": "Eo7WjKq67rjJQSZxS6z3YkapzY3eMj6Xy8X5EQVn5UaB",  # Meteora DLMM
+        self.dex_factories = dict(DEX_FACTORIES)
+        self.dex_factory_keys = {
+            dex_name: _pubkey(factory_address)
+            for dex_name, factory_address in self.dex_factories.items()
         }
 
-        # Track recently discovered pairs
-        self.fresh_pairs = {}  # pair_address -> discovery_time
+        # Track recently discovered pairs, oldest first (insertion order)
+        self.fresh_pairs = {}  # pair_address -> discovery time (epoch ns)
+        self.pair_details = {}  # pair_address -> (fetched at ns, pair_info)
         self.callbacks = []  # List of callback functions for new discoveries
+        self.pending_details = {}  # pair_address -> in-flight details task
 
-        # Monitoring state
+        # Monitoring state - one websocket shared by all DEX subscriptions
         self.is_monitoring = False
-        self.websocket_connections = {}
+        self.websocket = None
+        self.subscription_dex = {}  # subscription id -> dex_name
+        self.event_queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
 
     async def start_realtime_monitoring(self, callback: Callable = None):
         """Start real-time monitoring of DEX factories"""
@@ -59,66 +209,113 @@ class RealtimeTokenSniffer:
 
         self.is_monitoring = True
 
-        # Start monitoring tasks for each DEX
-        tasks = []
-        for dex_name, factory_address in self.dex_factories.items():
-            task = asyncio.create_task(
-                self._monitor_dex_factory(dex_name, factory_address)
-            )
-            tasks.append(task)
-
-        # Start cleanup task
-        cleanup_task = asyncio.create_task(self._cleanup_old_pairs())
-        tasks.append(cleanup_task)
-
+        # A failure in any task cancels the others before cleanup runs
         try:
-            await asyncio.gather(*tasks)
-        except Exception as e:
-            logger.error(f"Monitoring error: {e}")
+            async with asyncio.TaskGroup() as task_group:
+                background_tasks = [
+                    task_group.create_task(self._cleanup_old_pairs()),
+                    *(
+                        task_group.create_task(self._process_queued_events())
+                        for _ in range(EVENT_WORKERS)
+                    ),
+                ]
+                await self._monitor_dex_factories()
+                for task in background_tasks:
+                    task.cancel()
+        except* Exception as errors:
+            for e in errors.exceptions:
+                logger.error(f"Monitoring error: {e}")
         finally:
             self.is_monitoring = False
             await self._cleanup()
 
-    async def _monitor_dex_factory(self, dex_name: str, factory_address: str):
-        """Monitor a specific DEX factory for new pair creation"""
-        logger.info(f"📡 Monitoring {dex_name} factory: {factory_address}")
-
-        try:
-            async with connect(self.wss_url) as websocket:
-                self.websocket_connections[dex_name] = websocket
-
-                # Subscribe to account changes for the factory
-                await websocket.account_subscribe(
-                    Pubkey.from_string(factory_address), commitment="confirmed"
-                )
-
-                # Also subscribe to logs mentioning the factory
-                # Note: Using a simpler approach due to API compatibility
-                try:
-                    await websocket.logs_subscribe(
-                        filter_="all",  # Listen to all logs for now
-                        commitment="confirmed",
-                    )
-                except Exception as log_error:
-                    logger.warning(
-                        f"Could not subscribe to logs for {dex_name}: {log_error}"
-                    )
-                    # Continue with just account monitoring
-
-                logger.info(f"✅ Subscribed to {dex_name} factory events")
+    async def _monitor_dex_factories(self):
+        """Monitor all DEX factories for new pair creation over one websocket"""
+        logger.info(f"📡 Monitoring DEX factories: {', '.join(self.dex_factories)}")
 
-                async for message in websocket:
-                    if not self.is_monitoring:
-                        break
-
-                    await self._process_factory_event(dex_name, message)
-
-        except Exception as e:
-            logger.error(f"Error monitoring {dex_name}: {e}")
-            # Attempt to reconnect after a delay
+        backoff = RECONNECT_BASE_DELAY_SECONDS
+        while self.is_monitoring:
+            try:
+                async with connect(
+                    self.wss_url,
+                    compression="deflate",
+                    max_size=WS_MAX_MESSAGE_BYTES,
+                    ping_interval=WS_PING_INTERVAL_SECONDS,
+                    ping_timeout=WS_PING_INTERVAL_SECONDS,
+                ) as websocket:
+                    self.websocket = websocket
+                    self.subscription_dex = {}
+
+                    # Send every subscription up front. Acks are matched to
+                    # their DEX by request id in the receive loop, because a
+                    # notification can arrive before a later subscription's ack
+                    pending_acks = {}  # request id -> dex_name
+                    request_ids = itertools.count(1)
+                    for dex_name, factory_key in self.dex_factory_keys.items():
+                        account_request = AccountSubscribe(
+                            factory_key,
+                            RpcAccountInfoConfig(commitment=CommitmentLevel.Confirmed),
+                            next(request_ids),
+                        )
+                        # Let the node filter logs instead of streaming all of them
+                        logs_request = LogsSubscribe(
+                            RpcTransactionLogsFilterMentions(factory_key),
+                            RpcTransactionLogsConfig(CommitmentLevel.Confirmed),
+                            next(request_ids),
+                        )
+                        for request in (account_request, logs_request):
+                            await websocket.send_data(request)
+                            pending_acks[request.id] = dex_name
+
+                    backoff = RECONNECT_BASE_DELAY_SECONDS
+
+                    async for messages in websocket:
+                        if not self.is_monitoring:
+                            break
+
+                        for message in messages:
+                            if isinstance(message, SubscriptionResult):
+                                dex_name = pending_acks.pop(message.id, "unknown")
+                                self.subscription_dex[message.result] = dex_name
+                                logger.info(
+                                    f"✅ Subscribed to {dex_name} factory events"
+                                )
+                                continue
+
+                            dex_name = self.subscription_dex.get(
+                                getattr(message, "subscription", None), "unknown"
+                            )
+                            self._enqueue_event(dex_name, message)
+
+            except (
+                OSError,
+                asyncio.TimeoutError,
+                websockets.WebSocketException,
+                SubscriptionError,
+            ) as e:
+                # Connection-level and rejected-subscription failures are
+                # retried; anything else is a bug
+                logger.error(f"Error monitoring DEX factories: {e}")
+            finally:
+                self.websocket = None
+
+            # Reconnect with capped exponential backoff plus jitter
             if self.is_monitoring:
-                await asyncio.sleep(5)
-                await self._monitor_dex_factory(dex_name, factory_address)
+                await asyncio.sleep(backoff + random.random())
+                backoff = min(backoff * 2, RECONNECT_MAX_DELAY_SECONDS)
+
+    def _enqueue_event(self, dex_name: str, message):
+        """Queue an event for the workers, dropping the oldest when full"""
+        if self.event_queue.full():
+            self.event_queue.get_nowait()
+            logger.warning("⚠️ Event queue full - dropped oldest event")
+        self.event_queue.put_nowait((dex_name, message))
+
+    async def _process_queued_events(self):
+        """Worker that processes queued websocket events"""
+        while True:
+            dex_name, message = await self.event_queue.get()
+            await self._process_factory_event(dex_name, message)
 
     async def _process_factory_event(self, dex_name: str, message):
         """Process incoming factory events to detect new pairs"""
@@ -140,12 +337,12 @@ class RealtimeTokenSniffer:
         # 2. Look for specific instruction signatures
         # 3. Check for token mint creation patterns
 
-        # For now, we'll use simple heuristics
-        event_str = str(event_data).lower()
-
-        pair_indicators = ["initialize", "create_pool", "new_pair", "liquidity", "mint"]
-
-        return any(indicator in event_str for indicator in pair_indicators)
+        # For now, we'll use simple heuristics. Logs notifications are
+        # matched on their log lines directly rather than on a repr of the
+        # whole notification object
+        if hasattr(getattr(event_data, "value", None), "logs"):
+            return any(map(_PAIR_INDICATOR_RE.search, _event_logs(event_data)))
+        return _PAIR_INDICATOR_RE.search(str(event_data)) is not None
 
     async def _handle_new_pair_detected(self, dex_name: str, event_data):
         """Handle detection of a new pair"""
@@ -154,8 +351,7 @@ class RealtimeTokenSniffer:
             pair_address = self._extract_pair_address(event_data)
 
             if pair_address and pair_address not in self.fresh_pairs:
-                discovery_time = datetime.utcnow()
-                self.fresh_pairs[pair_address] = discovery_time
+                self.fresh_pairs[pair_address] = time.time_ns()
 
                 logger.info(f"🆕 NEW PAIR DETECTED on {dex_name}: {pair_address}")
 
@@ -163,40 +359,52 @@ class RealtimeTokenSniffer:
                 pair_info = await self._get_pair_details(pair_address, dex_name)
 
                 if pair_info:
-                    # Notify callbacks
-                    for callback in self.callbacks:
-                        try:
-                            await callback(pair_info)
-                        except Exception as e:
-                            logger.error(f"Callback error: {e}")
+                    self.pair_details[pair_address] = (time.time_ns(), pair_info)
+
+                    # Notify callbacks concurrently so one slow subscriber
+                    # does not hold up the others
+                    results = await asyncio.gather(
+                        *(callback(pair_info) for callback in self.callbacks),
+                        return_exceptions=True,
+                    )
+                    for result in results:
+                        if isinstance(result, Exception):
+                            logger.error(f"Callback error: {result}")
 
         except Exception as e:
             logger.error(f"Error handling new pair: {e}")
 
     def _extract_pair_address(self, event_data) -> Optional[str]:
-        """Extract pair address from event data (simplified implementation)"""
-        # This is a placeholder - real implementation would need to:
-        # 1. Parse Solana transaction logs properly
-        # 2. Understand each DEX's specific event structure
-        # 3. Extract the actual pair/pool address
-
-        # For now, return None to avoid false positives
-        return None
+        """Extract pair address from event data"""
+        # Only Raydium pool initialization is decoded so far; Orca and
+        # Meteora events return None to avoid false positives
+        return _raydium_pool_from_logs(_event_logs(event_data))
 
     async def _get_pair_details(
         self, pair_address: str, dex_name: str
+    ) -> Optional[Dict]:
+        """Get pair details, sharing one request between concurrent callers"""
+        task = self.pending_details.get(pair_address)
+        if task is None:
+            task = asyncio.create_task(self._fetch_pair_details(pair_address, dex_name))
+            self.pending_details[pair_address] = task
+            task.add_done_callback(
+                lambda _: self.pending_details.pop(pair_address, None)
+            )
+        return await asyncio.shield(task)
+
+    async def _fetch_pair_details(
+        self, pair_address: str, dex_name: str
     ) -> Optional[Dict]:
         """Get detailed information about a newly discovered pair"""
         try:
             # First, try to get info from DexScreener (might not be indexed yet)
-            dexscreener_url = (
-                f"https://api.dexscreener.com/latest/dex/pairs/solana/{pair_address}"
-            )
-
             try:
-                response = await self.http_client.get(dexscreener_url)
+                response = await self.http_client.get(
+                    DEXSCREENER_PAIRS_URL + pair_address
+                )
                 if response.status_code == 200:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     if data.get("pair"):
                         logger.info(f"✅ Found pair on DexScreener: {pair_address}")
                         return self._format_pair_info(
@@ -219,57 +427,84 @@ class RealtimeTokenSniffer:
         self, pair_address: str, dex_name: str
     ) -> Optional[Dict]:
         """Get pair information directly from blockchain"""
-        try:
-            # Get account info for the pair
-            account_info = await self.client.get_account_info(
-                Pubkey.from_string(pair_address)
-            )
-
-            if not account_info.value:
-                return None
-
-            # This is a simplified implementation
-            # Real implementation would need to parse the account data
-            # based on each DEX's specific data structures
-
-            discovery_time = self.fresh_pairs.get(pair_address, datetime.utcnow())
-            age_minutes = (datetime.utcnow() - discovery_time).total_seconds() / 60
+        pair_infos = await self._get_pairs_info_from_blockchain(
+            [pair_address], dex_name
+        )
+        return pair_infos[0] if pair_infos else None
+
+    async def _get_pairs_info_from_blockchain(
+        self, pair_addresses: List[str], dex_name: str
+    ) -> List[Dict]:
+        """Get pair information for many pairs with batched getMultipleAccounts"""
+        batches = [
+            pair_addresses[i : i + RPC_ACCOUNTS_BATCH_SIZE]
+            for i in range(0, len(pair_addresses), RPC_ACCOUNTS_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self.client.get_multiple_accounts([_pubkey(addr) for addr in batch])
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
 
-            return {
-                "pair_address": pair_address,
-                "dex_name": dex_name,
-                "base_symbol": "UNKNOWN",
-                "quote_symbol": "SOL",  # Most new pairs are against SOL
-                "total_liquidity_usd": 0,  # Would need to calculate
-                "volume_24h_usd": 0,
-                "age_hours": age_minutes / 60,
-                "discovery_method": "blockchain_realtime",
-                "discovery_time": discovery_time.isoformat(),
-                "raw_blockchain_data": True,
-            }
+        now_ns = time.time_ns()
+        pair_infos = []
+        for batch, response in zip(batches, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Error getting blockchain info for {batch}: {response}")
+                continue
+
+            for pair_address, account in zip(batch, response.value):
+                if not account:
+                    continue
+
+                # This is a simplified implementation
+                # Real implementation would need to parse the account data
+                # based on each DEX's specific data structures
+
+                discovery_ns = self.fresh_pairs.get(pair_address, now_ns)
+
+                pair_infos.append(
+                    {
+                        "pair_address": pair_address,
+                        "dex_name": dex_name,
+                        "base_symbol": "UNKNOWN",
+                        "quote_symbol": "SOL",  # Most new pairs are against SOL
+                        "total_liquidity_usd": 0,  # Would need to calculate
+                        "volume_24h_usd": 0,
+                        "age_hours": (now_ns - discovery_ns) / NS_PER_HOUR,
+                        "discovery_method": "blockchain_realtime",
+                        "discovery_time": _iso_from_ns(discovery_ns),
+                        "raw_blockchain_data": True,
+                    }
+                )
 
-        except Exception as e:
-            logger.error(f"Error getting blockchain info for {pair_address}: {e}")
-            return None
+        return pair_infos
 
     def _format_pair_info(
         self, pair_data: Dict, dex_name: str, from_blockchain: bool = False
     ) -> Dict:
         """Format pair information for consistency"""
-        discovery_time = datetime.utcnow()
+        discovery_ns = time.time_ns()
 
-        # Calculate age from creation time if available
+        # Calculate age from creation time (epoch ms) if available
         age_hours = 0
-        if pair_data.get("pairCreatedAt"):
-            created_time = datetime.fromtimestamp(pair_data["pairCreatedAt"] / 1000)
-            age_hours = (discovery_time - created_time).total_seconds() / 3600
+        created_ms = pair_data.get("pairCreatedAt")
+        if created_ms:
+            age_hours = (discovery_ns // 1_000_000 - created_ms) / 3_600_000
+
+        # Resolve each nested section once instead of per field
+        base_token = pair_data.get("baseToken") or {}
+        quote_token = pair_data.get("quoteToken") or {}
+        txns_24h = (pair_data.get("txns") or {}).get("h24") or {}
 
         return {
             "pair_address": pair_data.get("pairAddress", ""),
-            "base_token": pair_data.get("baseToken", {}).get("address", ""),
-            "quote_token": pair_data.get("quoteToken", {}).get("address", ""),
-            "base_symbol": pair_data.get("baseToken", {}).get("symbol", "UNKNOWN"),
-            "quote_symbol": pair_data.get("quoteToken", {}).get("symbol", "SOL"),
+            "base_token": base_token.get("address", ""),
+            "quote_token": quote_token.get("address", ""),
+            "base_symbol": base_token.get("symbol", "UNKNOWN"),
+            "quote_symbol": quote_token.get("symbol", "SOL"),
             "dex_name": dex_name,
             "total_liquidity_usd": float(
                 pair_data.get("liquidity", {}).get("usd", 0) or 0
@@ -279,54 +514,108 @@ class RealtimeTokenSniffer:
             "price_change_24h": float(
                 pair_data.get("priceChange", {}).get("h24", 0) or 0
             ),
-            "txns_24h": (pair_data.get("txns", {}).get("h24", {}).get("buys", 0) or 0)
-            + (pair_data.get("txns", {}).get("h24", {}).get("sells", 0) or 0),
+            "txns_24h": (txns_24h.get("buys", 0) or 0)
+            + (txns_24h.get("sells", 0) or 0),
             "market_cap_usd": float(pair_data.get("marketCap", 0) or 0),
             "age_hours": age_hours,
             "discovery_method": "blockchain_realtime"
             if from_blockchain
             else "dexscreener_realtime",
-            "discovery_time": discovery_time.isoformat(),
+            "discovery_time": _iso_from_ns(discovery_ns),
             "volume_to_liquidity_ratio": 0,  # Calculate if needed
             "raw_data": pair_data,
         }
 
     async def get_fresh_pairs_last_24h(self) -> List[Dict]:
         """Get all pairs discovered in the last 24 hours"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=24)
+        now_ns = time.time_ns()
+        cutoff_ns = now_ns - FRESH_WINDOW_NS
 
+        # Walk newest first and stop at the first pair outside the window,
+        # reusing details fetched within the TTL
         fresh_pairs = []
-        for pair_address, discovery_time in self.fresh_pairs.items():
-            if discovery_time >= cutoff_time:
-                pair_info = await self._get_pair_details(pair_address, "unknown")
-                if pair_info:
-                    fresh_pairs.append(pair_info)
+        stale_addresses = []
+        for pair_address in reversed(self.fresh_pairs):
+            if self.fresh_pairs[pair_address] < cutoff_ns:
+                break
+            cached = self.pair_details.get(pair_address)
+            if cached and now_ns - cached[0] < PAIR_DETAILS_TTL_NS:
+                fresh_pairs.append(cached[1])
+            else:
+                stale_addresses.append(pair_address)
+
+        # Refresh the rest: one DexScreener request per batch, blockchain
+        # lookups for pairs it has not indexed
+        indexed = await self._fetch_dexscreener_pairs(stale_addresses)
+        refreshed = [
+            self._format_pair_info(
+                indexed[pair_address], "unknown", from_blockchain=True
+            )
+            for pair_address in stale_addresses
+            if pair_address in indexed
+        ]
+        unindexed = [addr for addr in stale_addresses if addr not in indexed]
+        refreshed.extend(
+            await self._get_pairs_info_from_blockchain(unindexed, "unknown")
+        )
+
+        for pair_info in refreshed:
+            if pair_info["pair_address"] in self.fresh_pairs:
+                self.pair_details[pair_info["pair_address"]] = (now_ns, pair_info)
+        fresh_pairs.extend(refreshed)
 
         # Sort by discovery time (newest first)
         fresh_pairs.sort(key=lambda x: x.get("discovery_time", ""), reverse=True)
         return fresh_pairs
 
+    async def _fetch_dexscreener_pairs(self, pair_addresses: List[str]) -> Dict:
+        """Look up pairs on DexScreener in batches, keyed by pair address"""
+        batches = [
+            pair_addresses[i : i + DEXSCREENER_BATCH_SIZE]
+            for i in range(0, len(pair_addresses), DEXSCREENER_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self.http_client.get(DEXSCREENER_PAIRS_URL + ",".join(batch))
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
+
+        indexed = {}
+        for response in responses:
+            if isinstance(response, Exception) or response.status_code != 200:
+                continue  # Not indexed yet or unavailable - fall back to chain
+            for pair in orjson.loads(response.content).get("pairs") or []:
+                indexed[pair.get("pairAddress")] = pair
+        return indexed
+
     async def _cleanup_old_pairs(self):
-        """Periodically clean up old pair records"""
+        """Clean up old pair records as soon as they expire"""
         while self.is_monitoring:
             try:
-                cutoff_time = datetime.utcnow() - timedelta(
-                    hours=48
-                )  # Keep 48h history
-
-                pairs_to_remove = [
-                    pair_addr
-                    for pair_addr, discovery_time in self.fresh_pairs.items()
-                    if discovery_time < cutoff_time
-                ]
+                now_ns = time.time_ns()
+                cutoff_ns = now_ns - RETENTION_NS  # Keep 48h history
+
+                # Expired pairs form a prefix of the insertion-ordered dict
+                pairs_to_remove = list(
+                    itertools.takewhile(
+                        lambda pair_addr: self.fresh_pairs[pair_addr] < cutoff_ns,
+                        self.fresh_pairs,
+                    )
+                )
 
                 for pair_addr in pairs_to_remove:
                     del self.fresh_pairs[pair_addr]
+                    self.pair_details.pop(pair_addr, None)
 
                 if pairs_to_remove:
                     logger.info(f"🧹 Cleaned up {len(pairs_to_remove)} old pair records")
 
-                await asyncio.sleep(3600)  # Clean up every hour
+                # Sleep until the oldest remaining pair expires; pairs added
+                # meanwhile expire a full retention window after they arrive
+                oldest_ns = next(iter(self.fresh_pairs.values()), now_ns)
+                await asyncio.sleep((oldest_ns + RETENTION_NS - now_ns) / 1e9)
 
             except Exception as e:
                 logger.error(f"Cleanup error: {e}")
@@ -335,18 +624,20 @@ class RealtimeTokenSniffer:
     async def _cleanup(self):
         """Clean up resources"""
         try:
-            # Close websocket connections
-            for dex_name, ws in self.websocket_connections.items():
+            # Close the shared websocket connection
+            if self.websocket:
                 try:
-                    await ws.close()
+                    await self.websocket.close()
                 except Exception as e:
-                    logger.error(f"Error closing {dex_name} websocket: {e}")
+                    logger.error(f"Error closing websocket: {e}")
 
             # Close HTTP client
-            await self.http_client.aclose()
+            if self.owns_http_client:
+                await self.http_client.aclose()
 
             # Close Solana client
-            await self.client.close()
+            if self.owns_client:
+                await self.client.close()
 
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
@@ -364,10 +655,16 @@ class MempoolSniffer:
     This gives the earliest possible detection of new pairs
     """
 
-    def __init__(self, rpc_url: str):
+    def __init__(self, rpc_url: str, client: Optional[AsyncClient] = None):
         self.rpc_url = rpc_url
-        self.client = AsyncClient(rpc_url)
+        self.owns_client = client is None
+        self.client = client or AsyncClient(rpc_url)
         self.is_monitoring = False
+        self.callbacks = []
+        self.signature_cursors = {}  # dex_name -> newest signature seen
+        self._transaction_semaphore = asyncio.Semaphore(
+            MAX_CONCURRENT_TRANSACTION_FETCHES
+        )
 
     async def start_mempool_monitoring(self, callback: Callable = None):
         """Monitor mempool for pending pair creation transactions"""
@@ -376,6 +673,9 @@ class MempoolSniffer:
         # Note: Solana doesn't have a traditional mempool like Ethereum
         # Instead, we can monitor recent transactions and catch them very quickly
 
+        if callback:
+            self.callbacks.append(callback)
+
         self.is_monitoring = True
 
         try:
@@ -386,27 +686,96 @@ class MempoolSniffer:
         except Exception as e:
             logger.error(f"Mempool monitoring error: {e}")
         finally:
-            await self.client.close()
+            if self.owns_client:
+                await self.client.close()
 
     async def _scan_recent_transactions(self):
         """Scan recent transactions for pair creation patterns"""
+        await asyncio.gather(
+            *(
+                self._scan_dex_transactions(dex_name, DEX_FACTORIES[dex_name])
+                for dex_name in _POOL_DECODERS
+            )
+        )
+
+    async def _scan_dex_transactions(self, dex_name: str, factory_address: str):
+        """Inspect the transactions a DEX factory saw since the last poll"""
         try:
-            # Get recent signatures
-            signatures = await self.client.get_signatures_for_address(
-                Pubkey.from_string(
-                    "11111111111111111111111111111111"
-                ),  # System program
-                limit=20,
+            # Only signatures newer than the cursor come back, so an idle
+            # factory costs an empty response
+            cursor = self.signature_cursors.get(dex_name)
+            if cursor is None:
+                # First poll only establishes the cursor
+                signatures = await self.client.get_signatures_for_address(
+                    _pubkey(factory_address), limit=1
+                )
+                if signatures.value:
+                    self.signature_cursors[dex_name] = signatures.value[0].signature
+                return
+
+            # Pages come newest first; page backward with before= until the
+            # cursor is reached so bursts above one page aren't lost
+            new_signatures = []
+            before = None
+            for _ in range(MAX_SIGNATURE_PAGES_PER_POLL):
+                page = await self.client.get_signatures_for_address(
+                    _pubkey(factory_address),
+                    before=before,
+                    until=cursor,
+                    limit=SIGNATURE_PAGE_LIMIT,
+                )
+                new_signatures.extend(page.value)
+                if len(page.value) < SIGNATURE_PAGE_LIMIT:
+                    break
+                before = page.value[-1].signature
+            else:
+                logger.warning(
+                    f"⚠️ Over {len(new_signatures)} new {dex_name} signatures "
+                    f"since the last poll - skipped those between {cursor} "
+                    f"and {before}"
+                )
+
+            if not new_signatures:
+                return
+            self.signature_cursors[dex_name] = new_signatures[0].signature
+
+            await asyncio.gather(
+                *(
+                    self._inspect_transaction(dex_name, sig_info.signature)
+                    for sig_info in new_signatures
+                    if sig_info.err is None  # Only successful transactions
+                )
             )
 
-            for sig_info in signatures.value:
-                if sig_info.err is None:  # Only successful transactions
-                    # This is a simplified check - real implementation would
-                    # need to parse transaction instructions properly
-                    pass
+        except Exception as e:
+            logger.error(f"Error scanning recent {dex_name} transactions: {e}")
+
+    async def _inspect_transaction(self, dex_name: str, signature: Signature):
+        """Fetch a transaction and report it if it created a new pair"""
+        try:
+            async with self._transaction_semaphore:
+                transaction = await self.client.get_transaction(
+                    signature, max_supported_transaction_version=0
+                )
+            meta = transaction.value and transaction.value.transaction.meta
+            logs = (meta.log_messages if meta else None) or []
+            pair_address = _POOL_DECODERS[dex_name](logs)
+            if not pair_address:
+                return
+
+            logger.info(f"🆕 NEW PAIR TRANSACTION on {dex_name}: {pair_address}")
+            pair_info = {
+                "pair_address": pair_address,
+                "dex_name": dex_name,
+                "signature": str(signature),
+                "discovery_method": "mempool_realtime",
+                "discovery_time": _iso_from_ns(time.time_ns()),
+            }
+            for callback in self.callbacks:
+                await callback(pair_info)
 
         except Exception as e:
-            logger.error(f"Error scanning recent transactions: {e}")
+            logger.error(f"Error inspecting transaction {signature}: {e}")
 
     def stop_monitoring(self):
         """Stop mempool monitoring"""
@@ -417,17 +786,30 @@ class MempoolSniffer:
 class RealtimeSnifferFactory:
     """Factory for creating different types of real-time sniffers"""
 
+    # Sniffers close only the clients they create. To share connection pools,
+    # the caller builds one client per endpoint, passes it to every sniffer
+    # and closes it on shutdown
+
     @staticmethod
     def create_blockchain_sniffer(
-        rpc_url: str = None, wss_url: str = None
+        rpc_url: str = None,
+        wss_url: str = None,
+        client: Optional[AsyncClient] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> RealtimeTokenSniffer:
         """Create a blockchain monitoring sniffer"""
         return RealtimeTokenSniffer(
             rpc_url=rpc_url or "https://api.mainnet-beta.solana.com",
             wss_url=wss_url or "wss://api.mainnet-beta.solana.com",
+            client=client,
+            http_client=http_client,
         )
 
     @staticmethod
-    def create_mempool_sniffer(rpc_url: str = None) -> MempoolSniffer:
+    def create_mempool_sniffer(
+        rpc_url: str = None, client: Optional[AsyncClient] = None
+    ) -> MempoolSniffer:
         """Create a mempool monitoring sniffer"""
-        return MempoolSniffer(rpc_url=rpc_url or "https://api.mainnet-beta.solana.com")
+        return MempoolSniffer(
+            rpc_url=rpc_url or "https://api.mainnet-beta.solana.com", client=client
+        )
@@ -4,16 +4,37 @@ Uses periodic blockchain scanning instead of WebSocket monitoring
 More reliable and easier to implement
 """
 import asyncio
+import heapq
+import itertools
 import logging
-from datetime import datetime, timedelta
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
 from typing import Callable, Dict, List, Optional
 
 import httpx
-from solana.rpc.async_api import AsyncClient
-from solders.pubkey import Pubkey
+
+from .dexscreener_massive import MassiveDexScreenerClient
 
 logger = logging.getLogger(__name__)
 
+# Windows measured back from now against each pair's discovery time
+ULTRA_FRESH_WINDOW_SECONDS = 2 * 3600
+FRESH_WINDOW_SECONDS = 24 * 3600
+RETENTION_SECONDS = 48 * 3600
+CLEANUP_INTERVAL_SECONDS = 3600
+
+
+@dataclass(slots=True)
+class FreshPair:
+    """Discovered pair with its sort and cutoff keys lifted out of the dict"""
+
+    pair_address: str
+    age_hours: float
+    discovery_epoch: float
+    data: Dict
+
 
 class SimpleRealtimeSniffer:
     """
@@ -21,14 +42,29 @@ class SimpleRealtimeSniffer:
     More reliable than WebSocket monitoring, still much faster than DexScreener
     """
 
-    def __init__(self, rpc_url: str = "https://api.mainnet-beta.solana.com"):
-        self.rpc_url = rpc_url
-        self.client = AsyncClient(rpc_url)
-        self.http_client = httpx.AsyncClient()
+    def __init__(
+        self,
+        rpc_url: str = "https://api.mainnet-beta.solana.com",
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.rpc_url = rpc_url  # Kept for on-chain scanning; no RPC client is opened
+
+        # DexScreener requests share one HTTP/2 connection pool; an injected
+        # client belongs to the caller and is left open on cleanup
+        self.owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        )
+
+        # One DexScreener scanner reused across scans keeps its connections warm
+        self.dex_scanner = MassiveDexScreenerClient(client=self.http_client)
 
-        # Track discovered pairs
-        self.fresh_pairs = {}  # pair_address -> discovery_data
+        # Track discovered pairs, oldest discovery first (insertion order)
+        self.fresh_pairs: Dict[str, FreshPair] = {}
         self.callbacks = []
+        self.batch_callbacks = []  # Called once per scan with all new pairs
 
         # Monitoring state
         self.is_monitoring = False
@@ -51,14 +87,9 @@ class SimpleRealtimeSniffer:
 
         self.is_monitoring = True
 
-        # Start monitoring tasks
-        tasks = [
-            asyncio.create_task(self._periodic_blockchain_scan()),
-            asyncio.create_task(self._cleanup_old_pairs()),
-        ]
-
+        # Scanning and hourly cleanup share a single loop
         try:
-            await asyncio.gather(*tasks)
+            await self._periodic_blockchain_scan()
         except Exception as e:
             logger.error(f"Monitoring error: {e}")
         finally:
@@ -70,9 +101,14 @@ class SimpleRealtimeSniffer:
         logger.info("📡 Starting periodic blockchain scanning...")
 
         last_scan_signature = None
+        last_cleanup = time.monotonic()
 
         while self.is_monitoring:
             try:
+                if time.monotonic() - last_cleanup >= CLEANUP_INTERVAL_SECONDS:
+                    self._cleanup_old_pairs()
+                    last_cleanup = time.monotonic()
+
                 # Get recent signatures from known DEX programs
                 new_pairs = await self._scan_recent_transactions(last_scan_signature)
 
@@ -81,6 +117,7 @@ class SimpleRealtimeSniffer:
 
                 if new_pairs:
                     logger.info(f"🆕 Found {len(new_pairs)} new pairs in this scan")
+                    await self._notify_batch_callbacks(new_pairs)
 
                 await asyncio.sleep(self.scan_interval)
 
@@ -111,10 +148,16 @@ class SimpleRealtimeSniffer:
                         **pair,
                         "discovery_method": "realtime_dexscreener",
                         "discovery_time": discovery_time.isoformat(),
+                        "discovery_epoch": discovery_time.timestamp(),
                         "age_at_discovery": age_hours,
                     }
 
-                    self.fresh_pairs[pair_address] = pair_data
+                    self.fresh_pairs[pair_address] = FreshPair(
+                        pair_address=pair_address,
+                        age_hours=age_hours,
+                        discovery_epoch=pair_data["discovery_epoch"],
+                        data=pair_data,
+                    )
                     discovered_pairs.append(pair_data)
 
         except Exception as e:
@@ -124,16 +167,15 @@ class SimpleRealtimeSniffer:
 
     async def _get_recent_dexscreener_pairs(self) -> List[Dict]:
         """Get very recent pairs from DexScreener and parse them"""
-        from ..core.dexscreener_massive import MassiveDexScreenerClient
-
         try:
-            scanner = MassiveDexScreenerClient()
+            scanner = self.dex_scanner
+            scanner.seen_pairs.clear()  # Dedupe within this scan only
 
             # Get pairs but focus on very recent ones
-            raw_pairs = await scanner.get_latest_pairs()
+            raw_pairs = await scanner.get_latest_pairs(limit=200)  # First 200 pairs
             recent_pairs = []
 
-            for raw_pair in raw_pairs[:200]:  # Check first 200 pairs
+            for raw_pair in raw_pairs:
                 parsed = scanner.parse_pair_data(raw_pair)
                 if not parsed:
                     continue
@@ -142,17 +184,29 @@ class SimpleRealtimeSniffer:
                 if age_hours is not None and age_hours <= 3:  # Only very fresh pairs
                     recent_pairs.append(parsed)
 
-            await scanner.close()
-
-            # Sort by age (newest first)
-            recent_pairs.sort(key=lambda x: x.get("age_hours", 999))
-
-            return recent_pairs[:50]  # Return top 50 freshest
+            # Top 50 freshest (newest first)
+            return heapq.nsmallest(
+                50, recent_pairs, key=lambda x: x.get("age_hours", 999)
+            )
 
         except Exception as e:
             logger.error(f"Error getting recent DexScreener pairs: {e}")
             return []
 
+    def register_batch_callback(self, callback: Callable):
+        """Register a callback that receives each scan's new pairs as one list"""
+        self.batch_callbacks.append(callback)
+
+    async def _notify_batch_callbacks(self, new_pairs: List[Dict]):
+        """Hand all pairs found in a scan to the batch callbacks at once"""
+        results = await asyncio.gather(
+            *(callback(new_pairs) for callback in self.batch_callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Batch callback error: {result}")
+
     async def _handle_new_pair_detected(self, pair_data: Dict):
         """Handle a newly discovered pair"""
         try:
@@ -164,86 +218,76 @@ class SimpleRealtimeSniffer:
                 f"🆕 NEW FRESH PAIR: {base_symbol} ({age_hours:.1f}h old) - {pair_address}"
             )
 
-            # Notify callbacks
-            for callback in self.callbacks:
-                try:
-                    await callback(pair_data)
-                except Exception as e:
-                    logger.error(f"Callback error: {e}")
+            # Notify callbacks concurrently so one slow subscriber does not
+            # hold up the others
+            results = await asyncio.gather(
+                *(callback(pair_data) for callback in self.callbacks),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Callback error: {result}")
 
         except Exception as e:
             logger.error(f"Error handling new pair: {e}")
 
     async def get_fresh_pairs_last_24h(self) -> List[Dict]:
         """Get all pairs discovered in the last 24 hours"""
-        cutoff_time = datetime.now() - timedelta(hours=24)
+        cutoff_epoch = time.time() - FRESH_WINDOW_SECONDS
 
+        # Walk newest first and stop at the first pair discovered before the
+        # cutoff - everything after it in the dict is older still
         fresh_pairs = []
-        for pair_address, pair_data in self.fresh_pairs.items():
-            discovery_time_str = pair_data.get("discovery_time", "")
-            try:
-                discovery_time = datetime.fromisoformat(
-                    discovery_time_str.replace("Z", "+00:00")
-                )
-                discovery_time = discovery_time.replace(
-                    tzinfo=None
-                )  # Remove timezone for comparison
-
-                if discovery_time >= cutoff_time:
-                    fresh_pairs.append(pair_data)
-            except Exception:
-                # If we can't parse the time, include it anyway if it's recent
-                age_hours = pair_data.get("age_hours", 999)
-                if age_hours <= 24:
-                    fresh_pairs.append(pair_data)
-
-        # Sort by discovery time (newest first)
-        fresh_pairs.sort(key=lambda x: x.get("age_hours", 999))
-        return fresh_pairs[:20]  # Top 20 freshest
+        for fresh_pair in reversed(self.fresh_pairs.values()):
+            if fresh_pair.discovery_epoch < cutoff_epoch:
+                break
+            fresh_pairs.append(fresh_pair)
+
+        # Top 20 freshest (newest first)
+        freshest = heapq.nsmallest(20, fresh_pairs, key=attrgetter("age_hours"))
+        return [fresh_pair.data for fresh_pair in freshest]
 
     async def get_ultra_fresh_pairs(self) -> List[Dict]:
         """Get pairs discovered in the last 2 hours (ultra fresh)"""
-        cutoff_time = datetime.now() - timedelta(hours=2)
+        cutoff_epoch = time.time() - ULTRA_FRESH_WINDOW_SECONDS
 
+        # Same newest-first walk as the 24h listing, over a shorter window
         ultra_fresh = []
-        for pair_address, pair_data in self.fresh_pairs.items():
-            age_hours = pair_data.get("age_hours", 999)
-            if age_hours <= 2:  # Ultra fresh (< 2 hours)
-                ultra_fresh.append(pair_data)
-
-        # Sort by age (newest first)
-        ultra_fresh.sort(key=lambda x: x.get("age_hours", 999))
-        return ultra_fresh[:10]  # Top 10 ultra fresh
-
-    async def _cleanup_old_pairs(self):
-        """Periodically clean up old pair records"""
-        while self.is_monitoring:
-            try:
-                cutoff_time = datetime.now() - timedelta(hours=48)
-
-                pairs_to_remove = []
-                for pair_address, pair_data in self.fresh_pairs.items():
-                    age_hours = pair_data.get("age_hours", 0)
-                    if age_hours > 48:  # Remove pairs older than 48 hours
-                        pairs_to_remove.append(pair_address)
-
-                for pair_addr in pairs_to_remove:
-                    del self.fresh_pairs[pair_addr]
-
-                if pairs_to_remove:
-                    logger.info(f"🧹 Cleaned up {len(pairs_to_remove)} old pair records")
+        for fresh_pair in reversed(self.fresh_pairs.values()):
+            if fresh_pair.discovery_epoch < cutoff_epoch:
+                break
+            ultra_fresh.append(fresh_pair)
+
+        # Top 10 ultra fresh (newest first)
+        freshest = heapq.nsmallest(10, ultra_fresh, key=attrgetter("age_hours"))
+        return [fresh_pair.data for fresh_pair in freshest]
+
+    def _cleanup_old_pairs(self):
+        """Drop pair records discovered more than 48 hours ago"""
+        cutoff_epoch = time.time() - RETENTION_SECONDS
+
+        # Expired pairs form a prefix of the insertion-ordered dict
+        pairs_to_remove = list(
+            itertools.takewhile(
+                lambda pair_addr: (
+                    self.fresh_pairs[pair_addr].discovery_epoch < cutoff_epoch
+                ),
+                self.fresh_pairs,
+            )
+        )
 
-                await asyncio.sleep(3600)  # Clean up every hour
+        for pair_addr in pairs_to_remove:
+            del self.fresh_pairs[pair_addr]
 
-            except Exception as e:
-                logger.error(f"Cleanup error: {e}")
-                await asyncio.sleep(3600)
+        if pairs_to_remove:
+            logger.info(f"🧹 Cleaned up {len(pairs_to_remove)} old pair records")
 
     async def _cleanup(self):
         """Clean up resources"""
         try:
-            await self.http_client.aclose()
-            await self.client.close()
+            await self.dex_scanner.close()
+            if self.owns_http_client:
+                await self.http_client.aclose()
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
 
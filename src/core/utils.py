@@ -1,7 +1,8 @@
 import asyncio
 import json
 import logging
-from datetime import datetime, timedelta
+import time
+from collections import Counter
 from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -10,20 +11,33 @@ logger = logging.getLogger(__name__)
 class DataValidator:
     """Validates incoming data for quality and completeness"""
 
+    _REQUIRED_FIELDS = (
+        "pair_address",
+        "base_token",
+        "quote_token",
+        "base_symbol",
+        "quote_symbol",
+        "total_liquidity_usd",
+    )
+    _NUMERIC_FIELDS = frozenset(
+        (
+            "total_liquidity_usd",
+            "base_liquidity",
+            "quote_liquidity",
+            "volume_24h_usd",
+            "price_usd",
+            "price_change_24h",
+            "fdv_usd",
+            "market_cap_usd",
+        )
+    )
+    _INTEGER_FIELDS = frozenset(("txns_24h", "buyers_24h", "sellers_24h"))
+
     @staticmethod
     def validate_pair_data(pair_data: Dict) -> bool:
         """Validate pair data completeness"""
-        required_fields = [
-            "pair_address",
-            "base_token",
-            "quote_token",
-            "base_symbol",
-            "quote_symbol",
-            "total_liquidity_usd",
-        ]
-
-        for field in required_fields:
-            if field not in pair_data or pair_data[field] is None:
+        for field in DataValidator._REQUIRED_FIELDS:
+            if pair_data.get(field) is None:
                 logger.warning(f"Missing required field: {field}")
                 return False
 
@@ -46,35 +60,21 @@ class DataValidator:
         """Sanitize and normalize pair data"""
         sanitized = pair_data.copy()
 
-        # Ensure numeric fields are properly typed
-        numeric_fields = [
-            "total_liquidity_usd",
-            "base_liquidity",
-            "quote_liquidity",
-            "volume_24h_usd",
-            "price_usd",
-            "price_change_24h",
-            "fdv_usd",
-            "market_cap_usd",
-        ]
-
-        for field in numeric_fields:
-            if field in sanitized:
-                try:
-                    sanitized[field] = (
-                        float(sanitized[field]) if sanitized[field] else 0.0
-                    )
-                except (ValueError, TypeError):
-                    sanitized[field] = 0.0
+        # Ensure numeric fields are properly typed (only those present)
+        for field in DataValidator._NUMERIC_FIELDS & sanitized.keys():
+            value = sanitized[field]
+            try:
+                sanitized[field] = float(value) if value else 0.0
+            except (ValueError, TypeError):
+                sanitized[field] = 0.0
 
         # Ensure integer fields
-        integer_fields = ["txns_24h", "buyers_24h", "sellers_24h"]
-        for field in integer_fields:
-            if field in sanitized:
-                try:
-                    sanitized[field] = int(sanitized[field]) if sanitized[field] else 0
-                except (ValueError, TypeError):
-                    sanitized[field] = 0
+        for field in DataValidator._INTEGER_FIELDS & sanitized.keys():
+            value = sanitized[field]
+            try:
+                sanitized[field] = int(value) if value else 0
+            except (ValueError, TypeError):
+                sanitized[field] = 0
 
         return sanitized
 
@@ -83,31 +83,30 @@ class PerformanceMonitor:
     """Monitors system performance and collection metrics"""
 
     def __init__(self):
-        self.metrics = {
-            "pairs_processed": 0,
-            "alerts_generated": 0,
-            "api_calls": 0,
-            "errors": 0,
-            "start_time": datetime.utcnow(),
-        }
+        self.metrics = Counter(
+            pairs_processed=0,
+            alerts_generated=0,
+            api_calls=0,
+            errors=0,
+        )
+        self.start_time = time.monotonic()
 
     def increment_metric(self, metric_name: str, value: int = 1):
         """Increment a performance metric"""
-        if metric_name in self.metrics:
-            self.metrics[metric_name] += value
+        self.metrics[metric_name] += value
 
     def get_performance_summary(self) -> Dict:
         """Get current performance summary"""
-        uptime = datetime.utcnow() - self.metrics["start_time"]
+        uptime_seconds = time.monotonic() - self.start_time
 
         return {
-            "uptime_seconds": uptime.total_seconds(),
+            "uptime_seconds": uptime_seconds,
             "pairs_processed": self.metrics["pairs_processed"],
             "alerts_generated": self.metrics["alerts_generated"],
             "api_calls": self.metrics["api_calls"],
             "errors": self.metrics["errors"],
             "pairs_per_minute": self.metrics["pairs_processed"]
-            / max(uptime.total_seconds() / 60, 1),
+            / max(uptime_seconds / 60, 1),
             "error_rate": self.metrics["errors"]
             / max(self.metrics["pairs_processed"], 1),
         }
@@ -150,3 +149,57 @@ class ConfigManager:
         if key:
             return self.config.get(key)
         return self.config.copy()
+
+
+class AdaptiveTokenBucket:
+    """Token bucket whose refill rate rises on success and halves on failure"""
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        capacity: float = 20.0,
+        min_rate: float = 1.0,
+        max_rate: float = 30.0,
+        rate_step: float = 1.0,
+        backoff_factor: float = 0.5,
+    ):
+        self.rate = rate  # Tokens per second
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate_step = rate_step
+        self.backoff_factor = backoff_factor
+
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add the tokens accrued since the last refill"""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
+    async def acquire(self):
+        """Wait for a token; waiters are served in arrival order"""
+        async with self.lock:
+            self._refill()
+            # The rate can drop while we sleep, so recompute the deficit
+            # after every wake instead of trusting the first estimate
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+    def increase_rate(self):
+        """Additive increase after a successful request"""
+        self._refill()  # Credit the time so far at the old rate
+        self.rate = min(self.max_rate, self.rate + self.rate_step)
+
+    def decrease_rate(self):
+        """Multiplicative decrease after a failed or throttled request"""
+        self._refill()
+        self.rate = max(self.min_rate, self.rate * self.backoff_factor)
+        self.tokens = min(self.tokens, 0.0)  # No bursting while backing off
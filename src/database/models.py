@@ -4,9 +4,11 @@ from datetime import datetime
 from sqlalchemy import (Boolean, Column, DateTime, Float, Index, Integer,
                         String, Text)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import DeclarativeBase
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base shared by all models"""
 
 
 class TokenPair(Base):
@@ -71,7 +73,8 @@ class LiquiditySnapshot(Base):
     __table_args__ = (
         Index("idx_pair_timestamp", "pair_address", "timestamp"),
         Index("idx_liquidity_usd", "total_liquidity_usd"),
-        Index("idx_timestamp", "timestamp"),
+        # BRIN suits the append-only timestamp column far better than a btree
+        Index("idx_liq_ts_brin", "timestamp", postgresql_using="brin"),
     )
 
 
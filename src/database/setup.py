@@ -1,13 +1,56 @@
 import asyncio
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable
 
 import asyncpg
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from config.settings import settings
 
 from .models import Base
 
+# Column order used when COPYing snapshots; matches the pair_data keys
+# DataCollector builds for LiquiditySnapshot
+SNAPSHOT_COLUMNS = (
+    "pair_address",
+    "total_liquidity_usd",
+    "base_liquidity",
+    "quote_liquidity",
+    "volume_24h_usd",
+    "price_usd",
+    "price_change_24h",
+    "txns_24h",
+    "buyers_24h",
+    "sellers_24h",
+    "fdv_usd",
+    "market_cap_usd",
+)
+
+# Brings existing databases onto the BRIN timestamp index that create_all
+# only builds for new tables
+SNAPSHOT_INDEX_MIGRATION = (
+    "DROP INDEX IF EXISTS idx_timestamp",
+    "CREATE INDEX IF NOT EXISTS idx_liq_ts_brin "
+    "ON liquidity_snapshots USING BRIN (timestamp)",
+)
+
+
+def _orjson_serializer(value) -> str:
+    """JSONB encoder for SQLAlchemy, which expects text rather than bytes"""
+    return orjson.dumps(value).decode()
+
+
+def create_db_engine(database_url: str = None):
+    """SQLAlchemy engine that encodes and decodes JSONB columns with orjson"""
+    return create_engine(
+        database_url or settings.database_url,
+        json_serializer=_orjson_serializer,
+        json_deserializer=orjson.loads,
+    )
+
 
 async def create_database():
     """Create database if it doesn't exist"""
@@ -40,13 +83,44 @@ async def create_database():
 def create_tables():
     """Create all tables"""
     try:
-        engine = create_engine(settings.database_url)
+        engine = create_db_engine()
         Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            for statement in SNAPSHOT_INDEX_MIGRATION:
+                conn.execute(text(statement))
         print("✅ Created all database tables")
     except Exception as e:
         print(f"❌ Table creation error: {e}")
 
 
+async def bulk_insert_snapshots(pool: asyncpg.Pool, records: Iterable[Dict]) -> int:
+    """Append liquidity snapshots with a single COPY instead of ORM inserts"""
+    now = datetime.utcnow()
+    rows = [
+        (
+            uuid.uuid4(),
+            record.get("timestamp") or now,
+            *(record.get(column) for column in SNAPSHOT_COLUMNS),
+            (
+                orjson.dumps(record["raw_data"]).decode()
+                if record.get("raw_data") is not None
+                else None
+            ),
+        )
+        for record in records
+    ]
+    if not rows:
+        return 0
+
+    async with pool.acquire() as conn:
+        await conn.copy_records_to_table(
+            "liquidity_snapshots",
+            records=rows,
+            columns=["id", "timestamp", *SNAPSHOT_COLUMNS, "raw_data"],
+        )
+    return len(rows)
+
+
 async def setup_database():
     """Complete database setup"""
     print("🔧 Setting up database...")
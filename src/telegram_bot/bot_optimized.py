@@ -1,24 +1,30 @@
 import asyncio
-import json
+import bisect
 import logging
 import os
+import sqlite3
 import sys
+import time
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, List
 
+import httpx
+import orjson
+
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Message, Update
 from telegram.constants import ParseMode
 from telegram.error import NetworkError, RetryAfter, TimedOut
 from telegram.ext import (Application, CallbackQueryHandler, CommandHandler,
                           ContextTypes)
+from telegram.helpers import escape_markdown
 
 from src.core.dexscreener_massive import MassiveDexScreenerClient
 from src.core.liquidity_analyzer import LiquidityAnalyzer
+from src.core.utils import AdaptiveTokenBucket
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +32,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-user settings survive restarts in a small SQLite file (WAL journaling)
+USER_SETTINGS_DB_PATH = os.getenv("BOT_STATE_DB", "bot_state.sqlite")
+
+# Concurrent or back-to-back /quick calls with the same settings share a scan
+QUICK_SCAN_CACHE_TTL_SECONDS = 10
+QUICK_SCAN_SETTING_KEYS = (
+    "min_liquidity",
+    "min_volume",
+    "max_age_hours",
+    "max_scan_pairs",
+    "min_confidence",
+)
+
+# Alert-type keywords checked in order; the first match picks the emoji
+_ALERT_TYPE_EMOJI = (
+    ("BRAND_NEW", "🆕"),
+    ("VIRAL", "🚀"),
+    ("TRENDING", "🚀"),
+    ("FRESH", "🌟"),
+)
+
+# Freshness-priority score bands, looked up with bisect instead of if/elif chains
+_PRIORITY_AGE_BINS = (1, 6, 12, 24, 48, 72)  # hours, inclusive upper bounds
+_PRIORITY_AGE_POINTS = (0.5, 0.4, 0.3, 0.2, 0.1, 0.05, 0.0)
+_PRIORITY_MOMENTUM_BINS = (1.0, 2.0, 5.0)  # volume/liquidity, inclusive lower bounds
+_PRIORITY_MOMENTUM_POINTS = (0.0, 0.1, 0.2, 0.3)
+_PRIORITY_TXNS_BINS = (10, 20, 50, 100)  # 24h txns, inclusive lower bounds
+_PRIORITY_TXNS_POINTS = (0.0, 0.05, 0.1, 0.15, 0.2)
+
+
+def _emoji_for(alert_type: str, combined_score: float) -> str:
+    """Alert-type emoji, falling back to one based on the combined score"""
+    for keyword, emoji in _ALERT_TYPE_EMOJI:
+        if keyword in alert_type:
+            return emoji
+    return "📈" if combined_score >= 0.6 else "💡"
+
+
+def _passes_scan_floor(raw_pair: Dict, min_liquidity: float, min_volume: float) -> bool:
+    """Liquidity/volume floor on the raw pair, so rejects are never parsed"""
+    try:
+        # Same field reads as MassiveDexScreenerClient.parse_pair_data
+        liquidity = float(raw_pair.get("liquidity", {}).get("usd", 0) or 0)
+        volume = float(raw_pair.get("volume", {}).get("h24", 0) or 0)
+    except (AttributeError, TypeError, ValueError):
+        return False  # parse_pair_data would reject it too
+    return liquidity >= min_liquidity and volume >= min_volume
+
+
+# Markdown markers and the escapes added to token fields, removed in one pass
+_MARKDOWN_MARKERS = str.maketrans("", "", "*\\")
+
+
+def _strip_markdown(text: str) -> str:
+    """Plain-text fallback for a Markdown message: drop markers and escapes"""
+    return text.translate(_MARKDOWN_MARKERS)
+
 
 class OptimizedLiquidityBot:
     """Optimized Telegram Bot with proper error handling and /quick focus"""
@@ -33,12 +96,34 @@ class OptimizedLiquidityBot:
     def __init__(self, token: str):
         self.token = token
 
-        # Build application with timeout settings
+        # Build application with timeout settings; outgoing requests get a
+        # pool sized for concurrent updates, getUpdates keeps its own
         self.application = (
-            Application.builder().token(token).concurrent_updates(True).build()
+            Application.builder()
+            .token(token)
+            .concurrent_updates(True)
+            .connection_pool_size(64)
+            .pool_timeout(20)
+            .connect_timeout(10)
+            .read_timeout(25)
+            .write_timeout(25)
+            .get_updates_connection_pool_size(4)
+            .get_updates_pool_timeout(30)
+            .get_updates_connect_timeout(10)
+            .get_updates_read_timeout(25)
+            .get_updates_write_timeout(25)
+            .post_shutdown(self.post_shutdown)
+            .build()
         )
 
-        self.scheduler = AsyncIOScheduler()
+        # Scans share one DexScreener connection pool and one analyzer; each
+        # scan still gets its own scanner so dedup state stays per scan
+        self.http_client = httpx.AsyncClient(timeout=30.0)
+        self.analyzer = LiquidityAnalyzer()
+
+        # Outgoing sends/edits share one adaptive rate instead of each retry
+        # loop backing off on its own
+        self.rate_limiter = AdaptiveTokenBucket(rate=10, capacity=20)
 
         # Bot state
         self.is_monitoring = False
@@ -46,6 +131,8 @@ class OptimizedLiquidityBot:
         self.user_settings = {}
         self.last_scan_time = None
         self.last_opportunities = []
+        self.scan_cache = {}  # settings key -> (scanned at, opportunities)
+        self.pending_scans = {}  # settings key -> in-flight scan task
 
         # SNIFFER settings - optimized for fresh tokens
         self.default_settings = {
@@ -60,6 +147,18 @@ class OptimizedLiquidityBot:
             "prioritize_fresh": True,  # New flag for freshness priority
         }
 
+        # Persisted per-user settings; user_settings caches rows already read.
+        # The db is queried on the event loop: each user costs one primary-key
+        # read per process and one insert per /start, and with WAL plus
+        # synchronous=NORMAL a commit does not wait for an fsync
+        self.state_db = sqlite3.connect(USER_SETTINGS_DB_PATH, isolation_level=None)
+        self.state_db.execute("PRAGMA journal_mode=WAL")
+        self.state_db.execute("PRAGMA synchronous=NORMAL")
+        self.state_db.execute(
+            "CREATE TABLE IF NOT EXISTS user_settings"
+            "(uid INTEGER PRIMARY KEY, settings TEXT NOT NULL)"
+        )
+
         self.setup_handlers()
 
         # Add error handler
@@ -83,10 +182,37 @@ class OptimizedLiquidityBot:
                 except Exception:
                     logger.error("Failed to send timeout error message")
 
-        # If it's a retry after error, wait and retry
-        elif isinstance(context.error, RetryAfter):
-            logger.info(f"Rate limited, waiting {context.error.retry_after} seconds")
-            await asyncio.sleep(context.error.retry_after)
+    async def post_shutdown(self, application: Application) -> None:
+        """Close the shared DexScreener connection pool and state db on bot exit"""
+        await self.http_client.aclose()
+        self.state_db.close()
+
+    def get_user_settings(self, user_id: int) -> Dict:
+        """Settings for a user, read from the state db once and then cached"""
+        settings = self.user_settings.get(user_id)
+        if settings is not None:
+            return settings
+
+        row = self.state_db.execute(
+            "SELECT settings FROM user_settings WHERE uid = ?", (user_id,)
+        ).fetchone()
+
+        # Defaults fill in keys added since the row was written. Users without
+        # a row get their own copy so callers can never edit the defaults
+        settings = dict(self.default_settings)
+        if row is not None:
+            settings.update(orjson.loads(row[0]))
+        self.user_settings[user_id] = settings
+        return settings
+
+    def init_user_settings(self, user_id: int) -> Dict:
+        """Store default settings for a new user, keeping an existing user's"""
+        self.state_db.execute(
+            "INSERT OR IGNORE INTO user_settings (uid, settings) VALUES (?, ?)",
+            (user_id, orjson.dumps(self.default_settings).decode()),
+        )
+        self.user_settings.pop(user_id, None)  # Re-read the stored row
+        return self.get_user_settings(user_id)
 
     def setup_handlers(self):
         """Setup bot command handlers"""
@@ -113,53 +239,77 @@ class OptimizedLiquidityBot:
         self, update: Update, text: str, reply_markup=None, max_retries: int = 3
     ):
         """Safely send message with retry logic"""
+        return await self.safe_reply(update.message, text, reply_markup, max_retries)
+
+    async def safe_reply(
+        self, message: Message, text: str, reply_markup=None, max_retries: int = 3
+    ):
+        """Safely reply to a message with retry logic"""
         for attempt in range(max_retries):
+            await self.rate_limiter.acquire()
             try:
-                return await update.message.reply_text(
+                sent = await message.reply_text(
                     text, parse_mode=ParseMode.MARKDOWN, reply_markup=reply_markup
                 )
+                self.rate_limiter.increase_rate()
+                return sent
+            except RetryAfter as e:
+                logger.info(f"Rate limited, retrying send in {e.retry_after} seconds")
+                self.rate_limiter.decrease_rate()
+                await asyncio.sleep(e.retry_after)
             except (TimedOut, NetworkError) as e:
                 logger.warning(f"Send message attempt {attempt + 1} failed: {e}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2**attempt)  # Exponential backoff
-                else:
-                    # Final attempt without markdown
-                    try:
-                        return await update.message.reply_text(
-                            text.replace("**", "").replace("*", ""),
-                            reply_markup=reply_markup,
-                        )
-                    except Exception as final_error:
-                        logger.error(
-                            f"Failed to send message after all retries: {final_error}"
-                        )
-                        return None
+                self.rate_limiter.decrease_rate()
+
+        # Final attempt without markdown, also after a RetryAfter on the last try
+        logger.warning(f"Send failed after {max_retries} attempts, trying plain text")
+        return await self._plain_text_fallback(
+            lambda: message.reply_text(
+                _strip_markdown(text), reply_markup=reply_markup
+            ),
+            "send",
+        )
 
     async def safe_edit_message(self, message, text: str, max_retries: int = 3):
         """Safely edit message with retry logic"""
         for attempt in range(max_retries):
+            await self.rate_limiter.acquire()
             try:
-                return await message.edit_text(text, parse_mode=ParseMode.MARKDOWN)
+                edited = await message.edit_text(text, parse_mode=ParseMode.MARKDOWN)
+                self.rate_limiter.increase_rate()
+                return edited
+            except RetryAfter as e:
+                logger.info(f"Rate limited, retrying edit in {e.retry_after} seconds")
+                self.rate_limiter.decrease_rate()
+                await asyncio.sleep(e.retry_after)
             except (TimedOut, NetworkError) as e:
                 logger.warning(f"Edit message attempt {attempt + 1} failed: {e}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2**attempt)
-                else:
-                    # Final attempt without markdown
-                    try:
-                        return await message.edit_text(
-                            text.replace("**", "").replace("*", "")
-                        )
-                    except Exception as final_error:
-                        logger.error(
-                            f"Failed to edit message after all retries: {final_error}"
-                        )
-                        return None
+                self.rate_limiter.decrease_rate()
+
+        # Final attempt without markdown, also after a RetryAfter on the last try
+        logger.warning(f"Edit failed after {max_retries} attempts, trying plain text")
+        return await self._plain_text_fallback(
+            lambda: message.edit_text(_strip_markdown(text)), "edit"
+        )
+
+    async def _plain_text_fallback(self, request, action: str):
+        """Last plain-text attempt, reported to the rate limiter like the others"""
+        await self.rate_limiter.acquire()
+        try:
+            result = await request()
+        except (RetryAfter, TimedOut, NetworkError) as final_error:
+            self.rate_limiter.decrease_rate()
+            logger.error(f"Failed to {action} message after all retries: {final_error}")
+            return None
+        except Exception as final_error:
+            logger.error(f"Failed to {action} message after all retries: {final_error}")
+            return None
+        self.rate_limiter.increase_rate()
+        return result
 
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Welcome message focused on /quick"""
-        user_id = update.effective_user.id
-        self.user_settings[user_id] = self.default_settings.copy()
+        self.init_user_settings(update.effective_user.id)
 
         welcome_text = """
 🎯 **TOKEN SNIFFER BOT**
@@ -193,12 +343,15 @@ Hunt for FRESH Solana tokens before they moon!
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Fresh token sniffer scan with robust error handling"""
-        user_id = update.effective_user.id
-        settings = self.user_settings.get(user_id, self.default_settings)
+        await self._do_quick_scan(update.message, update.effective_user.id)
+
+    async def _do_quick_scan(self, message: Message, user_id: int):
+        """Run a scan for user_id, replying to message with progress and results"""
+        settings = self.get_user_settings(user_id)
 
         # Send initial message
-        scan_msg = await self.safe_send_message(
-            update,
+        scan_msg = await self.safe_reply(
+            message,
             "🎯 **TOKEN SNIFFER SCAN STARTING...**\n\n"
             "🔍 Hunting for fresh tokens (<72h old)...\n"
             "🚀 Looking for early opportunities...\n"
@@ -219,9 +372,9 @@ Hunt for FRESH Solana tokens before they moon!
                 if scan_msg:
                     success = await self.safe_edit_message(scan_msg, final_text)
                     if not success:
-                        await self.safe_send_message(update, final_text)
+                        await self.safe_reply(message, final_text)
                 else:
-                    await self.safe_send_message(update, final_text)
+                    await self.safe_reply(message, final_text)
 
                 self.last_opportunities = opportunities
                 self.last_scan_time = datetime.now()
@@ -236,9 +389,9 @@ Hunt for FRESH Solana tokens before they moon!
                 if scan_msg:
                     success = await self.safe_edit_message(scan_msg, no_results_text)
                     if not success:
-                        await self.safe_send_message(update, no_results_text)
+                        await self.safe_reply(message, no_results_text)
                 else:
-                    await self.safe_send_message(update, no_results_text)
+                    await self.safe_reply(message, no_results_text)
 
         except Exception as e:
             logger.error(f"Quick scan error: {e}")
@@ -251,57 +404,73 @@ Hunt for FRESH Solana tokens before they moon!
             if scan_msg:
                 success = await self.safe_edit_message(scan_msg, error_text)
                 if not success:
-                    await self.safe_send_message(update, error_text)
+                    await self.safe_reply(message, error_text)
             else:
-                await self.safe_send_message(update, error_text)
+                await self.safe_reply(message, error_text)
 
     async def run_quick_scan(self, settings: Dict) -> List[Dict]:
+        """Fresh token scan, sharing one scan between callers with equal settings"""
+        key = tuple(settings[name] for name in QUICK_SCAN_SETTING_KEYS)
+
+        cached = self.scan_cache.get(key)
+        if cached and time.monotonic() - cached[0] < QUICK_SCAN_CACHE_TTL_SECONDS:
+            return list(cached[1])
+
+        task = self.pending_scans.get(key)
+        if task is None:
+            task = asyncio.create_task(self._scan_fresh_opportunities(settings))
+            self.pending_scans[key] = task
+            task.add_done_callback(lambda _: self.pending_scans.pop(key, None))
+
+        opportunities = await asyncio.shield(task)
+        if opportunities:  # Failed or empty scans are not cached
+            self.scan_cache[key] = (time.monotonic(), opportunities)
+        return list(opportunities)
+
+    async def _scan_fresh_opportunities(self, settings: Dict) -> List[Dict]:
         """Fresh token sniffer scan - prioritize new opportunities"""
-        scanner = MassiveDexScreenerClient()
-        analyzer = LiquidityAnalyzer()
+        scanner = MassiveDexScreenerClient(client=self.http_client)
+        analyzer = self.analyzer
 
         try:
             # Get all pairs for comprehensive sniffer analysis
-            pairs = await scanner.get_latest_pairs()
+            pairs = await scanner.get_latest_pairs(limit=settings["max_scan_pairs"])
 
             # Use full analyzer for better fresh token detection
             fresh_opportunities = []
+            min_liquidity = settings["min_liquidity"]
+            min_volume = settings["min_volume"]
+            max_age_hours = settings["max_age_hours"]
+            min_confidence = settings["min_confidence"]
+
+            for raw_pair in pairs:
+                # Basic liquidity/volume filter before paying for a full parse
+                if not _passes_scan_floor(raw_pair, min_liquidity, min_volume):
+                    continue
 
-            for raw_pair in pairs[: settings["max_scan_pairs"]]:
                 parsed = scanner.parse_pair_data(raw_pair)
                 if not parsed:
                     continue
 
                 # Age filter - only fresh tokens
                 age_hours = parsed.get("age_hours")
-                if age_hours is not None and age_hours > settings["max_age_hours"]:
+                if age_hours is not None and age_hours > max_age_hours:
                     continue
 
-                # Basic liquidity/volume filter
-                if (
-                    parsed["total_liquidity_usd"] >= settings["min_liquidity"]
-                    and parsed["volume_24h_usd"] >= settings["min_volume"]
-                ):
-                    # Use full analyzer for proper scoring
-                    alert = await analyzer.analyze_pair(parsed)
-                    if (
-                        alert
-                        and alert.get("combined_score", 0) >= settings["min_confidence"]
-                    ):
-                        fresh_opportunities.append(alert)
-
-            # Sort by combined score (opportunity + freshness)
-            fresh_opportunities.sort(
-                key=lambda x: x.get("combined_score", 0), reverse=True
-            )
+                # Use full analyzer for proper scoring
+                alert = await analyzer.analyze_pair(parsed)
+                if alert and alert["combined_score"] >= min_confidence:
+                    fresh_opportunities.append(alert)
+
+            # Sort by combined score (opportunity + freshness); analyze_pair
+            # sets combined_score on every alert it returns
+            fresh_opportunities.sort(key=itemgetter("combined_score"), reverse=True)
 
             return fresh_opportunities
 
         except Exception as e:
             logger.error(f"Error in run_quick_scan: {e}")
             return []
-        finally:
-            await scanner.close()
 
     def calculate_freshness_priority_score(self, parsed: Dict) -> float:
         """Freshness-priority scoring for sniffer mode"""
@@ -310,38 +479,20 @@ Hunt for FRESH Solana tokens before they moon!
 
         # Age is the primary factor
         if age_hours is not None:
-            if age_hours <= 1:  # Brand new
-                score += 0.5
-            elif age_hours <= 6:  # Very fresh
-                score += 0.4
-            elif age_hours <= 12:  # Fresh
-                score += 0.3
-            elif age_hours <= 24:  # New
-                score += 0.2
-            elif age_hours <= 48:  # Recent
-                score += 0.1
-            elif age_hours <= 72:  # Still acceptable
-                score += 0.05
+            score += _PRIORITY_AGE_POINTS[
+                bisect.bisect_left(_PRIORITY_AGE_BINS, age_hours)
+            ]
 
         # Volume-to-liquidity ratio (momentum indicator)
         vol_to_liq = parsed.get("volume_to_liquidity_ratio", 0)
-        if vol_to_liq >= 5.0:  # High momentum
-            score += 0.3
-        elif vol_to_liq >= 2.0:  # Good momentum
-            score += 0.2
-        elif vol_to_liq >= 1.0:  # Some momentum
-            score += 0.1
+        score += _PRIORITY_MOMENTUM_POINTS[
+            bisect.bisect_right(_PRIORITY_MOMENTUM_BINS, vol_to_liq)
+        ]
 
         # Activity level
-        txns = parsed["txns_24h"]
-        if txns >= 100:
-            score += 0.2
-        elif txns >= 50:
-            score += 0.15
-        elif txns >= 20:
-            score += 0.1
-        elif txns >= 10:
-            score += 0.05
+        score += _PRIORITY_TXNS_POINTS[
+            bisect.bisect_right(_PRIORITY_TXNS_BINS, parsed["txns_24h"])
+        ]
 
         return min(score, 1.0)
 
@@ -350,21 +501,13 @@ Hunt for FRESH Solana tokens before they moon!
         if not opportunities:
             return "No fresh opportunities found matching your criteria."
 
-        text = f"**🎯 TOP {len(opportunities)} FRESH TOKENS:**\n\n"
+        scan_time = datetime.now().strftime("%H:%M UTC")
+        parts = [f"**🎯 TOP {len(opportunities)} FRESH TOKENS:**\n\n"]
 
         for i, opp in enumerate(opportunities, 1):
             # Emoji based on freshness and alert type
-            alert_type = opp.get("alert_type", "")
-            if "BRAND_NEW" in alert_type:
-                emoji = "🆕"
-            elif "VIRAL" in alert_type or "TRENDING" in alert_type:
-                emoji = "🚀"
-            elif "FRESH" in alert_type:
-                emoji = "🌟"
-            elif opp.get("combined_score", 0) >= 0.6:
-                emoji = "📈"
-            else:
-                emoji = "💡"
+            combined_score = opp.get("combined_score", 0)
+            emoji = _emoji_for(opp.get("alert_type", ""), combined_score)
 
             age_hours = opp.get("age_hours")
             if age_hours is not None:
@@ -375,28 +518,32 @@ Hunt for FRESH Solana tokens before they moon!
             else:
                 age_str = "unknown"
 
-            # Show key sniffer metrics
-            text += f"{emoji} **{i}. {opp['base_symbol']}/{opp['quote_symbol']}**\n"
-            text += f"   🕐 **{age_str} old** | 📍 {opp['dex_name']}\n"
-            text += f"   💰 ${opp['liquidity_usd']:,.0f} liquidity\n"
-            text += f"   📊 ${opp['volume_24h_usd']:,.0f} volume\n"
+            # Token symbols and DEX ids are third-party text; a stray "_" or
+            # "*" in them would make Telegram reject the whole message
+            pair_name = escape_markdown(f"{opp['base_symbol']}/{opp['quote_symbol']}")
+            dex_name = escape_markdown(opp["dex_name"])
 
-            # Show freshness and combined scores
+            # Show key sniffer metrics, freshness and combined scores
             freshness_score = opp.get("freshness_score", 0)
-            combined_score = opp.get("combined_score", 0)
-            text += f"   ⚡ {freshness_score:.2f} fresh | 🎯 {combined_score:.2f} total\n"
+            parts.append(
+                f"{emoji} **{i}. {pair_name}**\n"
+                f"   🕐 **{age_str} old** | 📍 {dex_name}\n"
+                f"   💰 ${opp['liquidity_usd']:,.0f} liquidity\n"
+                f"   📊 ${opp['volume_24h_usd']:,.0f} volume\n"
+                f"   ⚡ {freshness_score:.2f} fresh | 🎯 {combined_score:.2f} total\n"
+            )
 
             # Show momentum indicators
             vol_to_liq = opp.get("volume_to_liquidity_ratio", 0)
             if vol_to_liq > 0:
-                text += f"   🔥 {vol_to_liq:.1f}x turnover"
+                parts.append(f"   🔥 {vol_to_liq:.1f}x turnover")
 
             if opp.get("price_change_24h"):
-                text += f" | 📈 {opp['price_change_24h']:+.1f}%"
-            text += "\n\n"
+                parts.append(f" | 📈 {opp['price_change_24h']:+.1f}%")
+            parts.append("\n\n")
 
-        text += f"🕐 Sniffer scan at {datetime.now().strftime('%H:%M UTC')}"
-        return text
+        parts.append(f"🕐 Sniffer scan at {scan_time}")
+        return "".join(parts)
 
     async def scan_disabled_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -455,9 +602,7 @@ Hunt for FRESH Solana tokens before they moon!
         await query.answer()
 
         if query.data == "quick_scan":
-            # Create fake update for quick scan
-            fake_update = Update(update_id=query.id, message=query.message)
-            await self.quick_scan_command(fake_update, context)
+            await self._do_quick_scan(query.message, query.from_user.id)
         elif query.data == "help":
             await query.edit_message_text(
                 "📚 **HELP**\n\nUse /quick for fast scans!\n"
@@ -574,15 +719,8 @@ Hunt for FRESH Solana tokens before they moon!
         logger.info("⚡ Primary command: /quick")
         logger.info("🔧 Enhanced error handling enabled")
 
-        # Start polling with reasonable timeouts
-        self.application.run_polling(
-            allowed_updates=Update.ALL_TYPES,
-            timeout=20,
-            read_timeout=25,
-            write_timeout=25,
-            connect_timeout=10,
-            pool_timeout=5,
-        )
+        # Request timeouts live on the builder; timeout is the long-poll wait
+        self.application.run_polling(allowed_updates=Update.ALL_TYPES, timeout=20)
 
 
 # Main execution
@@ -0,0 +1,74 @@
+"""
+Unit tests for the AIMD token bucket used to pace bot messages
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.utils import AdaptiveTokenBucket
+
+
+class TestAdaptiveTokenBucket:
+    """Tests for AdaptiveTokenBucket"""
+
+    def test_burst_up_to_capacity_without_waiting(self):
+        async def burst():
+            bucket = AdaptiveTokenBucket(rate=1, capacity=5)
+            start = time.monotonic()
+            for _ in range(5):
+                await bucket.acquire()
+            return time.monotonic() - start, bucket.tokens
+
+        elapsed, tokens = asyncio.run(burst())
+        assert elapsed < 0.1
+        assert 0 <= tokens < 1
+
+    def test_acquire_waits_for_refill(self):
+        async def drain_then_acquire():
+            bucket = AdaptiveTokenBucket(rate=20, capacity=1)
+            await bucket.acquire()
+            start = time.monotonic()
+            await bucket.acquire()
+            return time.monotonic() - start
+
+        assert asyncio.run(drain_then_acquire()) >= 0.04
+
+    def test_rate_is_additive_up_and_multiplicative_down(self):
+        bucket = AdaptiveTokenBucket(
+            rate=10, min_rate=2, max_rate=12, rate_step=1, backoff_factor=0.5
+        )
+        bucket.increase_rate()
+        bucket.increase_rate()
+        bucket.increase_rate()
+        assert bucket.rate == 12
+
+        bucket.decrease_rate()
+        assert bucket.rate == 6
+        bucket.decrease_rate()
+        bucket.decrease_rate()
+        assert bucket.rate == 2
+
+    def test_decrease_rate_drains_burst_tokens(self):
+        bucket = AdaptiveTokenBucket(rate=10, capacity=20)
+        bucket.decrease_rate()
+        assert bucket.tokens <= 0.01
+
+    def test_rate_drop_during_wait_never_overdraws(self):
+        async def cut_rate_while_waiting():
+            bucket = AdaptiveTokenBucket(rate=10, capacity=1, min_rate=0.5)
+            await bucket.acquire()
+
+            async def throttle():
+                await asyncio.sleep(0.02)
+                bucket.decrease_rate()
+                bucket.decrease_rate()
+
+            throttled = asyncio.create_task(throttle())
+            await bucket.acquire()
+            await throttled
+            return bucket.tokens
+
+        assert asyncio.run(cut_rate_while_waiting()) >= -1e-9
@@ -0,0 +1,119 @@
+"""
+Unit tests for LiveDiscoveryScanner's fetch retries and circuit breaker
+"""
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import src.core.live_discovery_feed as live_discovery_feed
+from src.core.live_discovery_feed import LiveDiscoveryScanner
+
+URL = "https://api.dexscreener.com/latest/dex/search/?q=pump"
+PAIRS_BODY = b'{"pairs": [{"pairAddress": "A"}, {"pairAddress": "B"}]}'
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(live_discovery_feed, "FETCH_RETRY_BASE_DELAY_SECONDS", 0)
+
+
+def scanner_with_responses(statuses):
+    """Scanner whose HTTP client answers with the given status codes in turn"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        status = statuses[min(len(requests), len(statuses)) - 1]
+        return httpx.Response(status, content=PAIRS_BODY if status == 200 else b"")
+
+    scanner = LiveDiscoveryScanner()
+    scanner.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return scanner, requests
+
+
+class TestCachedGetRetries:
+    """Tests for retrying transient failures in _cached_get"""
+
+    def test_transient_failures_are_retried(self):
+        scanner, requests = scanner_with_responses([503, 429, 200])
+
+        data = asyncio.run(scanner._cached_get(URL, max_pairs=1))
+
+        assert data == {"pairs": [{"pairAddress": "A"}]}
+        assert len(requests) == 3
+        assert URL not in scanner._failures
+
+    def test_client_errors_are_not_retried(self):
+        scanner, requests = scanner_with_responses([404])
+
+        assert asyncio.run(scanner._cached_get(URL)) is None
+        assert len(requests) == 1
+        assert URL not in scanner._failures
+
+    def test_network_errors_are_retried(self):
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            raise httpx.ConnectError("connection refused", request=request)
+
+        scanner = LiveDiscoveryScanner()
+        scanner.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert asyncio.run(scanner._cached_get(URL)) is None
+        assert len(attempts) == live_discovery_feed.FETCH_MAX_ATTEMPTS
+        assert scanner._failures[URL][0] == 1
+
+
+class TestCircuitBreaker:
+    """Tests for skipping endpoints that keep failing"""
+
+    def test_breaker_opens_after_threshold(self):
+        scanner, requests = scanner_with_responses([500])
+
+        async def fetch_repeatedly():
+            for _ in range(live_discovery_feed.CIRCUIT_BREAKER_THRESHOLD):
+                assert await scanner._cached_get(URL) is None
+            opened_at = len(requests)
+            assert await scanner._cached_get(URL) is None
+            return opened_at
+
+        opened_at = asyncio.run(fetch_repeatedly())
+
+        # The call after the threshold is skipped without touching the network
+        assert len(requests) == opened_at
+        assert opened_at == (
+            live_discovery_feed.CIRCUIT_BREAKER_THRESHOLD
+            * live_discovery_feed.FETCH_MAX_ATTEMPTS
+        )
+
+    def test_breaker_closes_after_cooldown_and_success(self):
+        scanner, requests = scanner_with_responses([200])
+        threshold = live_discovery_feed.CIRCUIT_BREAKER_THRESHOLD
+
+        # Tripped breaker whose cooldown has already run out
+        scanner._failures[URL] = (threshold, time.monotonic() - 1)
+
+        data = asyncio.run(scanner._cached_get(URL))
+
+        assert data["pairs"][0]["pairAddress"] == "A"
+        assert len(requests) == 1
+        assert URL not in scanner._failures
+
+    def test_open_breaker_still_serves_cached_response(self):
+        scanner, requests = scanner_with_responses([200])
+        threshold = live_discovery_feed.CIRCUIT_BREAKER_THRESHOLD
+
+        async def fetch_then_trip():
+            await scanner._cached_get(URL)
+            scanner._failures[URL] = (threshold, time.monotonic() + 60)
+            return await scanner._cached_get(URL)
+
+        assert asyncio.run(fetch_then_trip())["pairs"]
+        assert len(requests) == 1
@@ -0,0 +1,54 @@
+"""
+Unit tests for decoding Raydium AMM pool initialization logs
+"""
+import base64
+import os
+import struct
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.realtime_sniffer import _raydium_pool_from_logs
+
+# InitLog for a pool on the OpenBook market 8BnEgHoWFysVcuFFX7QztDmzuH8r5ZFvyP3sYwn1XTh6:
+# log_type 0, open_time 1700000000, pc/coin decimals 6/9, pc/coin lot sizes
+# 1/1000000, pc/coin amounts 50000000000/1000000000000, then the market pubkey
+INIT_RAY_LOG = (
+    "Program log: ray_log: "
+    "AADxU2UAAAAABgkBAAAAAAAAAEBCDwAAAAAAAHQ7pAsAAAAAEKXU6AAAAGrEw876nxm/"
+    "VMjcD15NHO7lMn0mSCsp0rE8uqQ0RyGN"
+)
+
+# PDA of (AMM program, market, b"amm_associated_seed") under the AMM program
+EXPECTED_POOL_ADDRESS = "F12892m67r6L2yKhjtDLB4YdrMAEVsDiVzgwLpgSy2SE"
+
+
+class TestRaydiumPoolDecode:
+    """Tests for _raydium_pool_from_logs"""
+
+    def test_init_log_yields_pool_address(self):
+        logs = [
+            "Program 675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8 invoke [1]",
+            "Program log: initialize2: InitializeInstruction2",
+            INIT_RAY_LOG,
+            "Program 675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8 success",
+        ]
+        assert _raydium_pool_from_logs(logs) == EXPECTED_POOL_ADDRESS
+
+    def test_swap_ray_log_is_ignored(self):
+        # SwapBaseIn logs (log_type 3) have a different size and no market
+        swap_payload = struct.pack("<B7Q", 3, 1, 2, 3, 4, 5, 6, 7)
+        logs = [
+            "Program log: ray_log: " + base64.b64encode(swap_payload).decode(),
+        ]
+        assert _raydium_pool_from_logs(logs) is None
+
+    def test_init_sized_log_with_other_type_is_ignored(self):
+        payload = bytearray(base64.b64decode(INIT_RAY_LOG.split(": ")[-1]))
+        payload[0] = 1
+        logs = ["Program log: ray_log: " + base64.b64encode(payload).decode()]
+        assert _raydium_pool_from_logs(logs) is None
+
+    def test_logs_without_ray_log(self):
+        assert _raydium_pool_from_logs([]) is None
+        assert _raydium_pool_from_logs(["Program log: Instruction: Swap"]) is None